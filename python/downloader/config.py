@@ -8,9 +8,12 @@ It also provides helper functions to generate yt-dlp configurations
 based on user preferences.
 """
 
+import copy
 import os
+import logging
+import functools
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 # === Default Settings === #
 
@@ -25,11 +28,100 @@ DEFAULT_BITRATE = 320  # in kbps
 DEFAULT_TIMEOUT = 30  # seconds
 DEFAULT_MAX_RETRIES = 3
 
+# Back-off between retries, keyed by yt-dlp retry type (argument is the attempt number)
+RETRY_SLEEP_FUNCTIONS = {
+    'http': lambda n: min(4, 2 ** n),
+    'fragment': lambda n: 1,
+}
+
+# Per-user cache directory (e.g. the FFmpeg location found by a previous run)
+CACHE_DIR = Path(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~/.cache")) / "audit_downloader"
+
+# Upper bound on the cover art kept in CACHE_DIR/artwork (least recently used go first)
+ARTWORK_CACHE_MAX_BYTES = 256 * 1024 * 1024  # bytes
+
+# RAM-backed directory for intermediate files (raw downloads, FFmpeg temp output)
+RAMDISK_PATH = os.environ.get("AUDIT_RAMDISK", "/dev/shm")
+# Rough upper bound on one intermediate file, used by the free-memory check
+RAMDISK_FILE_ESTIMATE = 256 * 1024 * 1024  # bytes
+RAMDISK_VIDEO_ESTIMATE = 2 * 1024 * 1024 * 1024  # bytes, mp4 keeps the video stream
+
+# FFmpeg encoder threads (leave one core for downloading and the UI)
+DEFAULT_FFMPEG_THREADS = max(1, (os.cpu_count() or 2) - 1)
+
 # Logging
 LOG_LEVEL = "INFO"
 
 # === Core yt-dlp Configuration === #
 
+# Audio formats FFmpegExtractAudio can produce
+SUPPORTED_AUDIO_FORMATS = ("mp3", "m4a", "flac", "wav", "opus")
+
+# Options that do not depend on the call arguments, deep-copied into every get_ydl_opts() result
+_BASE_YDL_OPTS: Dict[str, Any] = {
+    'format': 'bestaudio/best',
+    'noplaylist': True,  # overridden by core.py if needed
+    'ignoreerrors': True,
+    'no_warnings': False,  # Show warnings for debugging
+    'quiet': False,
+    'writethumbnail': True,
+    'embedthumbnail': True,
+    'prefer_ffmpeg': True,
+    'ffmpeg_location': None,  # Let yt-dlp find ffmpeg automatically
+    'cachedir': False,
+    'socket_timeout': DEFAULT_TIMEOUT,
+    'retries': DEFAULT_MAX_RETRIES,
+    'fragment_retries': DEFAULT_MAX_RETRIES,
+    'retry_sleep_functions': RETRY_SLEEP_FUNCTIONS,
+    'source_address': None,
+    'geo_bypass': True,
+    # yt-dlp expects a mapping of executable/postprocessor name to arguments
+    'postprocessor_args': {
+        'ffmpeg': [
+            '-threads', str(DEFAULT_FFMPEG_THREADS),
+            '-movflags', 'use_metadata_tags',
+            '-id3v2_version', '3',
+            '-write_id3v1', '1',
+            '-strict', 'experimental',
+        ],
+    },
+    'logger': logging.getLogger('yt-dlp'),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _build_postprocessors(format: str, bitrate: int) -> Tuple[Dict[str, Any], ...]:
+    """Build the postprocessor chain for an audio format.
+
+    Returned as a tuple so the cached value itself cannot be extended;
+    get_ydl_opts() hands out copies of the entries.
+
+    This is the generic three-pass chain. core.download_media doesn't use it:
+    for MP3 it registers postprocess.SingleShotFFmpegPP, which converts, tags
+    and embeds the cover in one FFmpeg run. That class can't be named here,
+    because yt-dlp only resolves 'key' entries to its built-in postprocessors.
+    """
+    return (
+        # First extract the audio
+        {
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': format,
+            'preferredquality': str(bitrate)
+        },
+        # Then embed the thumbnail
+        {
+            'key': 'EmbedThumbnail',
+            'already_have_thumbnail': False
+        },
+        # Finally add metadata
+        {
+            'key': 'FFmpegMetadata',
+            'add_metadata': True,
+            'add_chapters': True
+        },
+    )
+
+
 def get_ydl_opts(
     output_dir: str,
     format: str = DEFAULT_FORMAT,
@@ -44,72 +136,20 @@ def get_ydl_opts(
         bitrate: Audio bitrate in kbps
 
     Returns:
-        dict: yt-dlp configuration options
+        dict: yt-dlp configuration options. Nested values are copied too, so
+        callers may modify any part of it without affecting later calls.
     """
-
-    # Base postprocessors configuration
-    postprocessors = []
-
-    # === AUDIO CONVERSION ===
-    if format in ["mp3", "m4a", "flac", "wav", "opus"]:
-        # Add FFmpeg audio conversion
-        postprocessors.append({
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': format,
-            'preferredquality': str(bitrate)
-        })
-    else:
+    if format not in SUPPORTED_AUDIO_FORMATS:
         raise ValueError(f"Unsupported audio format: {format}")
 
-    # === METADATA AND THUMBNAILS ===
-    postprocessors += [
-        {'key': 'FFmpegMetadata'},
-        {'key': 'EmbedThumbnail'}
-    ]
-
-    # === yt-dlp OPTIONS ===
-    ydl_opts = {
-        'format': 'bestaudio/best',
+    # deepcopy keeps the logger itself (loggers copy by name)
+    ydl_opts = copy.deepcopy(_BASE_YDL_OPTS)
+    ydl_opts.update({
         'outtmpl': os.path.join(output_dir, '%(title)s.%(ext)s'),
-        'noplaylist': True,  # overridden by core.py if needed
-        'ignoreerrors': True,
-        'no_warnings': False,  # Show warnings for debugging
-        'quiet': False,
-        'writethumbnail': True,
-        'writethumbnail': True,
-        'embedthumbnail': True,
-        'postprocessors': [
-            # First extract the audio
-            {
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': format,
-                'preferredquality': str(bitrate)
-            },
-            # Then embed the thumbnail
-            {
-                'key': 'EmbedThumbnail',
-                'already_have_thumbnail': False
-            },
-            # Finally add metadata
-            {
-                'key': 'FFmpegMetadata',
-                'add_metadata': True,
-                'add_chapters': True
-            }
-        ],
-        'prefer_ffmpeg': True,
-        'ffmpeg_location': None,  # Let yt-dlp find ffmpeg automatically
-        'cachedir': False,
-        'socket_timeout': DEFAULT_TIMEOUT,
-        'source_address': None,
-        'geo_bypass': True,
-        'postprocessor_args': [
-            '-movflags', 'use_metadata_tags',
-            '-id3v2_version', '3',
-            '-write_id3v1', '1',
-            '-strict', 'experimental'
-        ],
-        'logger': logging.getLogger('yt-dlp')
-    }
-
+        'postprocessors': [dict(pp) for pp in _build_postprocessors(format, bitrate)],
+        # Name the final container up front: no extra remux, and the
+        # already-downloaded check looks for the converted file
+        'merge_output_format': format,
+        'final_ext': format,
+    })
     return ydl_opts
@@ -11,53 +11,127 @@ Dependencies:
 - requests (for artwork download)
 """
 import os
+import re
+import json
 import logging
+import functools
+import shutil
+import queue
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Callable, Tuple, Any
 
 import yt_dlp
 
 # Importa le funzioni necessarie dal modulo postprocess
-from .postprocess import set_mp3_metadata, download_artwork
+from .postprocess import set_mp3_metadata, download_artwork, download_artworks, SingleShotFFmpegPP, ARTWORK_EMBEDDED_KEY
+from .config import (
+    DEFAULT_FFMPEG_THREADS, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT, RETRY_SLEEP_FUNCTIONS,
+    RAMDISK_PATH, RAMDISK_FILE_ESTIMATE, RAMDISK_VIDEO_ESTIMATE, CACHE_DIR,
+)
 from .utils import ensure_directory, sanitize_filename
 from .progress import reset_progress_state, set_playlist_info, calculate_progress
 
 logger = logging.getLogger(__name__)
 
-def check_ffmpeg():
-    """Check for FFmpeg in common locations and return the path if found."""
-    possible_paths = [
-        # Check in app.asar.unpacked (where asar.unpack puts it)
-        Path(__file__).parent.parent.parent / "ffmpeg" / "bin" / "ffmpeg.exe",
-        # Check in bundled ffmpeg (for packaged app)
-        Path(__file__).parent.parent / "ffmpeg" / "bin" / "ffmpeg.exe",
-        # Check in the same directory as the script
-        Path(__file__).parent / "ffmpeg.exe",
-        # Check in a subdirectory
-        Path(__file__).parent / "ffmpeg" / "bin" / "ffmpeg.exe",
-        # Check in the current working directory
-        Path("ffmpeg.exe"),
-        # Check in the system PATH
-        Path("ffmpeg"),
-        # Common Windows installation paths
-        Path("C:\\ffmpeg\\bin\\ffmpeg.exe"),
-        Path(os.environ.get("ProgramFiles", "C:\\Program Files")) / "ffmpeg" / "bin" / "ffmpeg.exe",
-        Path(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)")) / "ffmpeg" / "bin" / "ffmpeg.exe",
-    ]
+def _ffmpeg_candidates():
+    """Yield candidate FFmpeg locations lazily, in priority order."""
+    if os.name != 'nt':
+        # Only the working-directory binary applies; the rest are Windows builds
+        yield Path("ffmpeg")
+        return
+    # Check in app.asar.unpacked (where asar.unpack puts it)
+    yield Path(__file__).parent.parent.parent / "ffmpeg" / "bin" / "ffmpeg.exe"
+    # Check in bundled ffmpeg (for packaged app)
+    yield Path(__file__).parent.parent / "ffmpeg" / "bin" / "ffmpeg.exe"
+    # Check in the same directory as the script
+    yield Path(__file__).parent / "ffmpeg.exe"
+    # Check in a subdirectory
+    yield Path(__file__).parent / "ffmpeg" / "bin" / "ffmpeg.exe"
+    # Check in the current working directory
+    yield Path("ffmpeg.exe")
+    yield Path("ffmpeg")
+    # Common Windows installation paths
+    yield Path("C:\\ffmpeg\\bin\\ffmpeg.exe")
+    yield Path(os.environ.get("ProgramFiles", "C:\\Program Files")) / "ffmpeg" / "bin" / "ffmpeg.exe"
+    yield Path(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)")) / "ffmpeg" / "bin" / "ffmpeg.exe"
 
-    # Add paths from system PATH
-    path_env = os.environ.get("PATH", "")
-    path_dirs = [Path(p.strip()) for p in path_env.split(os.pathsep) if p.strip()]
-    
+def _scan_path_for_ffmpeg() -> Optional[str]:
+    """Look for FFmpeg in the PATH directories with one directory listing each.
+
+    Missing directories cost a single failed scandir; repeated PATH entries
+    are only listed once.
+    """
+    wanted = {"ffmpeg", "ffmpeg.exe"} if os.name == 'nt' else {"ffmpeg"}
+    path_dirs = dict.fromkeys(d.strip() for d in os.environ.get("PATH", "").split(os.pathsep))
     for path_dir in path_dirs:
-        possible_paths.extend([
-            path_dir / "ffmpeg",
-            path_dir / "ffmpeg.exe"
-        ])
+        if not path_dir:
+            continue
+        try:
+            with os.scandir(path_dir) as it:
+                for entry in it:
+                    if entry.name.lower() in wanted and (os.name == 'nt' or os.access(entry.path, os.X_OK)):
+                        return entry.path
+        except OSError:
+            continue
+    return None
+
+_FFMPEG_CACHE_FILE = CACHE_DIR / "ffmpeg.json"
+
+def _load_cached_ffmpeg() -> Optional[str]:
+    """Return the FFmpeg path saved by a previous run if the binary is unchanged."""
+    try:
+        with open(_FFMPEG_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        path = cached['ffmpeg_path']
+        if os.path.getmtime(path) == cached['mtime']:
+            return path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _save_cached_ffmpeg(path: str) -> None:
+    try:
+        _FFMPEG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_FFMPEG_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'ffmpeg_path': path, 'mtime': os.path.getmtime(path)}, f)
+    except OSError as e:
+        logger.debug(f"Could not cache the FFmpeg location: {e}")
+
+@functools.lru_cache(maxsize=1)
+def check_ffmpeg():
+    """Check for FFmpeg in common locations and return the path if found.
+
+    The result is cached for the lifetime of the process; call
+    ``invalidate_ffmpeg_cache()`` to force a new search. Across runs the
+    location is kept in ``CACHE_DIR/ffmpeg.json`` and reused while the
+    binary's mtime is unchanged.
+    """
+    cached = _load_cached_ffmpeg()
+    if cached:
+        return cached
+
+    found = _find_ffmpeg()
+    if found:
+        _save_cached_ffmpeg(found)
+    return found
+
+def invalidate_ffmpeg_cache() -> None:
+    """Forget the FFmpeg location, in memory and on disk (e.g. after installing FFmpeg)."""
+    check_ffmpeg.cache_clear()
+    try:
+        _FFMPEG_CACHE_FILE.unlink()
+    except OSError:
+        pass
 
-    # Check all possible paths
-    for path in possible_paths:
+def _find_ffmpeg() -> Optional[str]:
+    """Search the bundled, well-known and PATH locations for FFmpeg."""
+    # Bundled copies take precedence over whatever is on the system PATH
+    for path in _ffmpeg_candidates():
         try:
             if path.exists():
                 # On Windows, .exe files are executable by default
@@ -71,12 +145,30 @@ def check_ffmpeg():
         except Exception as e:
             logger.warning(f"Error checking {path}: {e}")
             continue
-    
+
+    # Single PATH scan (handles PATHEXT on Windows), then a direct listing of
+    # each PATH directory for installs which() misses (e.g. unusual PATHEXT)
+    found = shutil.which("ffmpeg") or _scan_path_for_ffmpeg()
+    if found:
+        logger.info(f"FFmpeg found at: {found}")
+        return str(Path(found).resolve())
+
     logger.error("FFmpeg not found in any of the standard locations")
     logger.info("Please download FFmpeg from https://ffmpeg.org/download.html and add it to your PATH")
     logger.info("or place ffmpeg.exe in the same directory as this script")
     return None
 
+# Common artist patterns in descriptions, in order of preference. Anchored to
+# line starts with bounded captures so matching stays linear on long descriptions
+_ARTIST_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+    r'^\s*artist\s*:\s*(.{1,200})',
+    r'^\s*artista\s*:\s*(.{1,200})',
+    r'^\s*by\s+(.{1,200})',
+    r'^\s*da\s+(.{1,200})',
+))
+# Artist credits sit near the top; don't scan further than this
+_ARTIST_DESCRIPTION_LINES = 50
+
 def _extract_artist(info: dict) -> str:
     """Extract artist information from video/audio metadata."""
     # 1. Try direct artist field
@@ -88,22 +180,17 @@ def _extract_artist(info: dict) -> str:
         return info['uploader']
     
     # 3. Try to extract from title (common format: "Artist - Song")
-    if 'title' in info and ' - ' in info['title']:
-        return info['title'].split(' - ')[0].strip()
+    title = info.get('title')
+    if title:
+        artist, sep, _ = title.partition(' - ')
+        if sep:
+            return artist.strip()
     
     # 4. Try to extract from description
     if info.get('description'):
-        import re
-        # Common patterns in descriptions
-        patterns = [
-            r'(?i)artist[:]\s*([^\n]+)',
-            r'(?i)artista[:]\s*([^\n]+)',
-            r'(?i)by\s+([^\n]+)',
-            r'(?i)da\s+([^\n]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, info['description'])
+        description = '\n'.join(info['description'].splitlines()[:_ARTIST_DESCRIPTION_LINES])
+        for pattern in _ARTIST_PATTERNS:
+            match = pattern.search(description)
             if match:
                 artist = match.group(1).strip()
                 if artist:  # Make sure we found something
@@ -112,79 +199,115 @@ def _extract_artist(info: dict) -> str:
     # 5. Last resort: return empty string
     return ''
 
-def _process_metadata(file_path: Path, info: dict, progress_callback: Optional[Callable] = None):
-    """Process metadata for a downloaded file."""
+def _build_tags(info: dict) -> dict:
+    """Build the tag set written to a track, keyed like set_mp3_metadata's arguments."""
+    artist = _extract_artist(info)
+    return {
+        'title': info.get('title', ''),
+        'artist': artist,
+        # Playlist entries fall back to the playlist title as album
+        'album': info.get('album') or info.get('playlist_title') or '',
+        'album_artist': info.get('artist') or artist or info.get('uploader', ''),
+        'track_number': int(info.get('track_number', 0)) if info.get('track_number') else 0,
+        'year': str(info.get('release_year') or info.get('release_date', '')[:4] if info.get('release_date') else ''),
+        'genre': ', '.join(info.get('genres', [])) if info.get('genres') else '',
+        'comment': f"Downloaded with yt-dlp from {info.get('webpage_url', '')}",
+    }
+
+def _artwork_embedded(info: dict) -> bool:
+    """Return True if SingleShotFFmpegPP already tagged the file and embedded its cover."""
+    downloads = info.get('requested_downloads') or [info]
+    return bool(downloads[0].get(ARTWORK_EMBEDDED_KEY))
+
+def _thumbnail_index(entries) -> dict:
+    """Map entry id -> thumbnail URL for a playlist's entries, built once per playlist."""
+    return {
+        e['id']: e['thumbnail'] for e in entries or ()
+        if isinstance(e, dict) and e.get('id') and e.get('thumbnail')
+    }
+
+def _best_thumbnail(thumbnails) -> Optional[str]:
+    """Return the URL of the largest thumbnail in a yt-dlp thumbnails list.
+
+    yt-dlp orders thumbnails from worst to best, so on equal (or unknown)
+    sizes the later one wins.
+    """
+    best = max(
+        ((i, t) for i, t in enumerate(thumbnails or ()) if t.get('url')),
+        key=lambda it: ((it[1].get('width') or 0) * (it[1].get('height') or 0), it[0]),
+        default=None
+    )
+    return best[1]['url'] if best else None
+
+def _parent_thumbnail(info: dict, parent_thumbs: Optional[dict]) -> Optional[str]:
+    """Return the thumbnail the parent playlist lists for this entry."""
+    if 'playlist_index' not in info:
+        return None
+    if parent_thumbs is None and isinstance(info.get('playlist'), list):
+        parent_thumbs = _thumbnail_index(info['playlist'])
+    return parent_thumbs.get(info.get('id')) if parent_thumbs else None
+
+def _youtube_thumbnail(info: dict) -> Optional[str]:
+    """Return the maxresdefault.jpg URL for YouTube videos."""
+    if info.get('id') and (info.get('extractor_key') or info.get('ie_key')) == 'Youtube':
+        return f"https://i.ytimg.com/vi/{info['id']}/maxresdefault.jpg"
+    return None
+
+def _pick_thumbnail(info: dict, parent_thumbs: Optional[dict] = None) -> Optional[str]:
+    """Return the URL of the best available thumbnail for an entry, if any.
+
+    ``parent_thumbs`` is the playlist's ``_thumbnail_index``, used when the
+    entry itself carries no thumbnail. The sources are tried in order and the
+    chain stops at the first hit, which for YouTube is nearly always the first.
+    """
+    return (
+        # 0. YouTube serves a predictable, CDN-cached JPEG for every video;
+        #    download_artwork falls back to hqdefault when maxres is missing
+        _youtube_thumbnail(info)
+        # 1. The entry's own thumbnail
+        or info.get('thumbnail')
+        # 2. The highest resolution one from the thumbnails list
+        or _best_thumbnail(info.get('thumbnails'))
+        # 3. For playlist items, the one listed by the parent playlist
+        or _parent_thumbnail(info, parent_thumbs)
+        # 4. For playlists, the first entry's thumbnail
+        or next((e['thumbnail'] for e in info.get('entries') or ()
+                 if isinstance(e, dict) and e.get('thumbnail')), None)
+        # 5. 'thumbnail_url' as a last resort
+        or info.get('thumbnail_url')
+    )
+
+def _process_metadata(
+    file_path: Path,
+    info: dict,
+    progress_callback: Optional[Callable] = None,
+    artwork: Optional[bytes] = None,
+    parent_thumbs: Optional[dict] = None
+):
+    """Process metadata for a downloaded file.
+
+    ``artwork`` may be passed in when it was already fetched; otherwise it is
+    downloaded from the entry's best thumbnail (see ``_pick_thumbnail``).
+    """
     try:
-        # Get the best available thumbnail
-        thumbnail_url = None
-        
-        # 1. First try to get the thumbnail from the entry's metadata (for playlist items)
-        if info.get('thumbnail'):
-            thumbnail_url = info['thumbnail']
-        # 2. Try to get the highest resolution thumbnail from thumbnails list
-        elif 'thumbnails' in info and info['thumbnails']:
-            # Filter out thumbnails without URL and sort by resolution (highest first)
-            valid_thumbnails = [t for t in info['thumbnails'] if t.get('url')]
-            if valid_thumbnails:
-                # Sort by resolution (width * height), highest first
-                valid_thumbnails.sort(
-                    key=lambda x: x.get('width', 0) * x.get('height', 0),
-                    reverse=True
-                )
-                thumbnail_url = valid_thumbnails[0]['url']
-        
-        # 3. For playlist items, try to get the thumbnail from the parent playlist
-        if not thumbnail_url and 'playlist_index' in info and 'playlist' in info and info['playlist']:
-            for entry in info['playlist']:
-                if isinstance(entry, dict) and entry.get('id') == info.get('id') and entry.get('thumbnail'):
-                    thumbnail_url = entry['thumbnail']
-                    break
-                    
-        # 4. For playlists, try to get the thumbnail from the first entry
-        if not thumbnail_url and 'entries' in info and info['entries']:
-            for entry in info['entries']:
-                if isinstance(entry, dict) and entry.get('thumbnail'):
-                    thumbnail_url = entry['thumbnail']
-                    break
-        
-        # 5. Fall back to standard thumbnail if no thumbnails list or no valid thumbnails
-        if not thumbnail_url and 'thumbnail' in info and info['thumbnail']:
-            thumbnail_url = info['thumbnail']
-        
-        # 6. Try to get from 'thumbnail_url' if still no thumbnail
-        if not thumbnail_url and 'thumbnail_url' in info and info['thumbnail_url']:
-            thumbnail_url = info['thumbnail_url']
-        
         # Download artwork if available
-        artwork = None
+        thumbnail_url = None if artwork else _pick_thumbnail(info, parent_thumbs)
         if thumbnail_url:
             try:
                 artwork = download_artwork(thumbnail_url)
             except Exception:
                 pass
         
-        # Extract artist information
-        artist = _extract_artist(info)
-        album_artist = info.get('artist') or artist or info.get('uploader', '')
-        
+        tags = _build_tags(info)
+
         # Log per debug
-        logger.info(f"Processing metadata for: {info.get('title', 'Unknown')}")
-        logger.info(f"Artist: {artist}, Uploader: {info.get('uploader', 'Not found')}")
-        logger.info(f"Album: {info.get('album', 'Not found')}, Album Artist: {album_artist}")
+        # Deferred %-formatting: nothing is built when INFO is filtered out
+        logger.info("Processing metadata for: %s", info.get('title', 'Unknown'))
+        logger.info("Artist: %s, Uploader: %s", tags['artist'], info.get('uploader', 'Not found'))
+        logger.info("Album: %s, Album Artist: %s", info.get('album', 'Not found'), tags['album_artist'])
         
         # Process metadata with all available info
-        set_mp3_metadata(
-            file_path=file_path,
-            title=info.get('title', ''),
-            artist=artist,
-            album=info.get('album', ''),
-            album_artist=album_artist,
-            track_number=int(info.get('track_number', 0)) if info.get('track_number') else 0,
-            year=str(info.get('release_year') or info.get('release_date', '')[:4] if info.get('release_date') else ''),
-            genre=', '.join(info.get('genres', [])) if info.get('genres') else '',
-            artwork=artwork,
-            comment=f"Downloaded with yt-dlp from {info.get('webpage_url', '')}"
-        )
+        set_mp3_metadata(file_path=file_path, artwork=artwork, **tags)
     except Exception:
         # Continue execution even if metadata processing fails
         pass
@@ -215,6 +338,317 @@ def update_ytdlp():
         logger.error(f"Failed to update yt-dlp: {e}")
         return False
 
+def _finalize_playlist_entry(
+    entry: dict,
+    info: dict,
+    format: str,
+    progress_callback: Optional[Callable] = None,
+    artwork: Optional[bytes] = None,
+    parent_thumbs: Optional[dict] = None
+) -> None:
+    """Rename a downloaded playlist entry after its title and write its metadata."""
+    # Get the downloaded file path
+    if 'requested_downloads' in entry and entry['requested_downloads']:
+        downloaded_file = entry['requested_downloads'][0]['filepath']
+    elif '_filename' in entry:
+        downloaded_file = entry['_filename']
+    else:
+        logger.warning(f"Could not determine file path for entry: {entry.get('title', 'Unknown')}")
+        return
+    
+    # Rename the file using the video title (plain strings: this runs once per entry)
+    title = entry.get('title', 'Unknown Title')
+    folder, name = os.path.split(downloaded_file)
+    suffix = os.path.splitext(name)[1]
+    new_path = os.path.join(folder, sanitize_filename(title) + suffix)
+    
+    try:
+        # Rename the file, atomically overwriting any existing target; a
+        # missing source surfaces here, so no separate exists() check is needed
+        if new_path != downloaded_file:
+            try:
+                os.replace(downloaded_file, new_path)
+            except FileNotFoundError:
+                logger.warning(f"File not found: {downloaded_file}")
+                return
+        downloaded_file = new_path
+        
+        # Process metadata and add cover art
+        if (format.lower() == 'mp3' and suffix.lower() == '.mp3'
+                and not _artwork_embedded(entry)):
+            # Ensure we have all necessary metadata
+            if 'webpage_url' not in entry and 'url' in info:
+                entry['webpage_url'] = info['url']
+            if 'uploader' not in entry and 'uploader' in info:
+                entry['uploader'] = info['uploader']
+            if 'artist' not in entry and 'artist' in info:
+                entry['artist'] = info['artist']
+            
+            # Add playlist title as album if not set
+            if 'album' not in entry and 'playlist' in info and info.get('playlist'):
+                entry['album'] = info.get('playlist_title', 'YouTube Playlist')
+            
+            _process_metadata(Path(downloaded_file), entry, progress_callback, artwork, parent_thumbs)
+            # logger.info removed to avoid Unicode errors on Windows
+            
+    except Exception as e:
+        logger.error(f"Error processing {downloaded_file}: {str(e)}", exc_info=True)
+
+def _ramdisk_dir(format: str, concurrency: int) -> Optional[str]:
+    """Create a scratch directory on the RAM disk.
+
+    Returns None when there is no RAM disk or when ``concurrency`` files of the
+    estimated size would take more than half of the free memory.
+    """
+    if not os.path.isdir(RAMDISK_PATH):
+        return None
+    try:
+        free = shutil.disk_usage(RAMDISK_PATH).free
+        try:
+            free = min(free, os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE'))
+        except (AttributeError, ValueError, OSError):
+            pass  # No sysconf (Windows) or no such variable: trust the RAM disk size
+        estimate = RAMDISK_VIDEO_ESTIMATE if format == 'mp4' else RAMDISK_FILE_ESTIMATE
+        if estimate * concurrency > free // 2:
+            logger.info("Not enough free memory for the RAM disk, writing temp files to the output folder")
+            return None
+        return tempfile.mkdtemp(prefix="audit-", dir=RAMDISK_PATH)
+    except OSError as e:
+        logger.warning(f"RAM disk unavailable: {str(e)}")
+        return None
+
+def _stage_in_ramdisk(ydl_opts: dict, ram_dir: Optional[str]) -> None:
+    """Point yt-dlp's temp path at ``ram_dir``; only finished files are moved to the output folder."""
+    paths = ydl_opts.setdefault('paths', {})
+    if os.path.isabs(ydl_opts['outtmpl']):
+        # yt-dlp ignores the temp path for absolute templates, so split the home folder off
+        paths['home'], ydl_opts['outtmpl'] = os.path.split(ydl_opts['outtmpl'])
+    if ram_dir:
+        paths['temp'] = ram_dir
+    else:
+        paths.pop('temp', None)
+
+# Extensions of the thumbnail files yt-dlp leaves behind
+_THUMBNAIL_EXTS = frozenset(('.jpg', '.jpeg', '.png', '.webp'))
+
+# Per-entry fields that are only needed while an entry is downloaded and processed
+_HEAVY_ENTRY_KEYS = frozenset((
+    'formats', 'thumbnails', 'requested_formats', 'subtitles',
+    'automatic_captions', 'heatmap', 'chapters',
+))
+
+def _download_playlist(
+    info: dict,
+    ydl_opts: dict,
+    format: str,
+    bitrate: int,
+    progress_callback: Optional[Callable] = None,
+    concurrency: int = 1
+) -> list:
+    """Download the entries of a flat-extracted playlist, overlapping network and FFmpeg work.
+
+    ``concurrency`` download threads, each with its own YoutubeDL instance,
+    resolve and download entries while as many worker threads run the
+    postprocessors and metadata step on finished downloads. The queue between
+    the two stages is bounded so only a few raw files are pending at once.
+
+    Only the flat stubs of ``info['entries']`` are held up front; each one is
+    resolved to full metadata just before it is downloaded.
+
+    Returns:
+        The processed entries (without format lists and thumbnails), in playlist order.
+    """
+    entries = [e for e in info['entries'] if e]
+    playlist_title = info.get('title', info.get('playlist_title', 'Playlist'))
+    concurrency = max(1, min(concurrency, len(entries)))
+    parent_thumbs = _thumbnail_index(entries)
+    pending: queue.Queue = queue.Queue(maxsize=2 * concurrency)
+    processed = {}
+
+    # Progress hooks now fire from several threads; keep reporting serialized
+    hook_lock = threading.Lock()
+
+    def serialized(hook):
+        def wrapper(d):
+            with hook_lock:
+                hook(d)
+        return wrapper
+
+    # Status messages from the workers share the lock so IPC lines don't interleave
+    report = serialized(progress_callback) if progress_callback else None
+
+    download_opts = {
+        **ydl_opts,
+        # Downloads only: conversion, thumbnail embedding and tagging run in the workers
+        'postprocessors': [],
+        'progress_hooks': [serialized(h) for h in ydl_opts.get('progress_hooks', [])],
+        # The id keeps concurrent downloads of identically titled entries apart;
+        # _finalize_playlist_entry renames the result after its title afterwards
+        'outtmpl': os.path.join(os.path.dirname(ydl_opts['outtmpl']), '%(title)s [%(id)s].%(ext)s'),
+    }
+    paths = ydl_opts.get('paths') or {}
+    final_dir = None
+    if paths.get('temp'):
+        # Raw downloads stay on the RAM disk; the workers move the converted file home
+        download_opts['paths'] = {'home': paths['temp']}
+        final_dir = os.path.join(paths['home'], os.path.dirname(ydl_opts['outtmpl']))
+
+    # One YoutubeDL per thread: instances are not safe to share
+    local = threading.local()
+    instances = []
+    instances_lock = threading.Lock()
+
+    def download_entry(index: int, entry: dict) -> None:
+        ydl = getattr(local, 'ydl', None)
+        if ydl is None:
+            ydl = local.ydl = yt_dlp.YoutubeDL(download_opts)
+            with instances_lock:
+                instances.append(ydl)
+        extra_info = {
+            'playlist': playlist_title,
+            'playlist_title': playlist_title,
+            'playlist_id': info.get('id'),
+            'playlist_index': index,
+            'playlist_autonumber': index,
+            'playlist_count': len(entries),
+            'n_entries': len(entries),
+        }
+        result = ydl.process_ie_result(entry, download=True, extra_info=extra_info)
+        if result:
+            pending.put((index, result))
+
+    def postprocess_worker(pp_ydl) -> None:
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            index, entry = item
+            if report:
+                # A failing callback must not end the worker before its None
+                # sentinel: the download threads would block on the full queue
+                try:
+                    report({
+                        "status": "info",
+                        "message": f"Converting {entry.get('title', 'Unknown')} ({index}/{len(entries)})...",
+                    })
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {str(e)}")
+            try:
+                downloads = entry.get('requested_downloads') or []
+                for i, download in enumerate(downloads):
+                    # requested_downloads only holds the fields that differ from the entry
+                    merged = {k: v for k, v in entry.items() if k != 'requested_downloads'}
+                    merged.update(download)
+                    if final_dir:
+                        merged['__finaldir'] = final_dir
+                    downloads[i] = pp_ydl.post_process(merged['filepath'], merged)
+                _finalize_playlist_entry(entry, info, format, report, parent_thumbs=parent_thumbs)
+                # Finished entries stay around until the playlist is done; drop
+                # the format lists and thumbnails so memory doesn't grow with it
+                processed[index] = {k: v for k, v in entry.items() if k not in _HEAVY_ENTRY_KEYS}
+            except Exception as e:
+                logger.error(f"Error post-processing {entry.get('title', 'Unknown')}: {str(e)}", exc_info=True)
+
+    pp_ydls = []
+    for _ in range(concurrency):
+        pp_ydl = yt_dlp.YoutubeDL(ydl_opts)
+        if format == 'mp3':
+            pp_ydl.add_post_processor(SingleShotFFmpegPP(pp_ydl, bitrate=bitrate, tags=_build_tags))
+        pp_ydls.append(pp_ydl)
+
+    workers = [
+        threading.Thread(target=postprocess_worker, args=(pp_ydl,), name="playlist-postprocess", daemon=True)
+        for pp_ydl in pp_ydls
+    ]
+    for worker in workers:
+        worker.start()
+
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="playlist-download")
+    try:
+        futures = [pool.submit(download_entry, index, entry) for index, entry in enumerate(entries, 1)]
+        for future in futures:
+            future.result()
+    finally:
+        # Stop scheduling new downloads if one of them failed
+        pool.shutdown(wait=True, cancel_futures=True)
+        for _ in workers:
+            pending.put(None)
+        for worker in workers:
+            worker.join()
+        for ydl in instances + pp_ydls:
+            ydl.close()
+
+    return [processed[i] for i in sorted(processed)]
+
+@functools.lru_cache(maxsize=16)
+def _build_format_selector(format: str, quality: Optional[str], fps: Optional[int]) -> str:
+    """Build the yt-dlp format selector; the same settings come back for every call of a session."""
+    if format != 'mp4':
+        # Audio: best audio available, it is converted anyway
+        return "bestaudio/best"
+
+    # Video resolution and FPS logic
+    height_filter = ""
+    fps_filter = ""
+
+    if quality and quality.lower() != 'best':
+        # Remove 'p' if present (e.g. 1080p -> 1080)
+        height = quality.lower().replace('p', '')
+        if height.isdigit():
+            height_filter = f"[height<={height}]"
+
+    if fps and fps > 0:
+        # If FPS is specified, prefer formats with that FPS or higher
+        fps_filter = f"[fps>={fps}]"
+
+    if height_filter or fps_filter:
+        # Try to get best video matching criteria, fallback to best video without criteria if needed
+        return f"bestvideo{height_filter}{fps_filter}+bestaudio/best{height_filter}{fps_filter}/best"
+    return "bestvideo+bestaudio/best"
+
+class _PlaylistState:
+    """Position in the playlist being downloaded, shared with the progress hook."""
+    __slots__ = ('current_index', 'total_count', 'playlist_name')
+
+    def __init__(self):
+        self.current_index = 0      # 0-based index of current file in playlist
+        self.total_count = 0        # Total number of files in playlist
+        self.playlist_name = None   # Name of the playlist (if available)
+
+def _track_playlist_progress(
+    state: _PlaylistState,
+    callback: Optional[Callable],
+    last_position: dict,
+    d: dict[str, Any]
+) -> None:
+    """yt-dlp progress hook: add the playlist position to ``d`` and forward it to _on_progress."""
+    # Update playlist state if this is a new playlist
+    playlist = d.get('playlist')
+    if playlist is not None and 'playlist_index' in d and 'playlist_count' in d:
+        state.current_index = d['playlist_index']
+        state.total_count = d['playlist_count']
+        if 'title' in playlist:
+            state.playlist_name = playlist['title']
+
+    # Add playlist info to the progress data
+    total_count = state.total_count
+    # Playlist entries download concurrently, so the entry itself says which one
+    # this tick belongs to (set through extra_info in _download_playlist)
+    entry_index = (d.get('info_dict') or {}).get('playlist_index')
+    if total_count > 0:
+        d['playlist_index'] = entry_index or state.current_index + 1  # 1-based index
+        d['playlist_count'] = total_count
+        d['playlist_name'] = state.playlist_name
+        d['isPlaylist'] = True
+
+    # Process progress through _on_progress
+    _on_progress(d, callback, last_position)
+
+    # Without an entry index, assume the next tick belongs to the next file
+    if (total_count > 0 and not entry_index and d.get('status') == 'finished'
+            and state.current_index < total_count - 1):
+        state.current_index += 1
+
 def download_media(
     url: str,
     output_dir: str,
@@ -224,12 +658,37 @@ def download_media(
     fps: Optional[int] = None,
     process_playlist: bool = False,
     progress_callback: Optional[Callable[[str, float], None]] = None,
-    max_retries: int = 3,
-    timeout: int = 300
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    timeout: int = DEFAULT_TIMEOUT,
+    concurrency: Optional[int] = None,
+    use_ramdisk: bool = False,
+    ffmpeg_threads: Optional[int] = None
 ) -> Tuple[bool, Optional[Path], str]:
     """
     Scarica media da YouTube (singolo video o playlist) e li converte nel formato desiderato.
+
+    ``max_retries`` bounds yt-dlp's HTTP and fragment retries and ``timeout`` is
+    the socket timeout in seconds. ``concurrency`` is the number of playlist
+    entries downloaded and converted in parallel (default: min(cpu_count, 4)).
+    With ``use_ramdisk`` raw downloads and FFmpeg temp files are written to a
+    RAM disk (``RAMDISK_PATH``) when there is enough free memory.
+    ``ffmpeg_threads`` is the thread count of each FFmpeg run, 0 meaning FFmpeg's
+    own choice (default: the CPU count shared among the concurrent playlist workers).
     """
+    # Normalized once; every format check below compares against lowercase names
+    format = format.lower()
+    if concurrency is None:
+        concurrency = min(os.cpu_count() or 1, 4)
+    # Library callers aren't validated by the CLI/JSON parsers; 0 would divide by zero below
+    concurrency = max(1, concurrency)
+    if ffmpeg_threads is None:
+        # Parallel playlist workers split the cores instead of each claiming all of them
+        ffmpeg_threads = (max(1, (os.cpu_count() or concurrency) // concurrency)
+                          if process_playlist else DEFAULT_FFMPEG_THREADS)
+    else:
+        # -threads 0 is FFmpeg's automatic choice; negative counts would make it fail
+        ffmpeg_threads = max(0, ffmpeg_threads)
+
     # Reset global progress state for each new download session
     reset_progress_state()
 
@@ -239,9 +698,12 @@ def download_media(
     update_ytdlp()
 
     ensure_directory(output_dir)
+    output_dir_path = Path(output_dir)
 
     ffmpeg_path = check_ffmpeg()
     if not ffmpeg_path:
+        # Don't keep the miss: the next call searches again once FFmpeg is installed
+        check_ffmpeg.cache_clear()
         error_msg = (
             "FFmpeg non trovato. "
             "FFmpeg è richiesto per la conversione in MP3.\n\n"
@@ -254,120 +716,83 @@ def download_media(
             progress_callback({"status": "error", "message": error_msg})
         return False, None, error_msg
 
-    # Initialize playlist tracking state
-    playlist_state = {
-        'current_index': 0,      # 0-based index of current file in playlist
-        'total_count': 0,        # Total number of files in playlist
-        'playlist_name': None    # Name of the playlist (if available)
-    }
-    
-    # Wrapper for progress callback to handle playlist tracking
-    def progress_wrapper(d):
-        nonlocal playlist_state
-        
-        # Update playlist state if this is a new playlist
-        if 'playlist' in d and d['playlist'] is not None:
-            if 'playlist_index' in d and 'playlist_count' in d:
-                playlist_state['current_index'] = d['playlist_index']
-                playlist_state['total_count'] = d['playlist_count']
-                if 'playlist' in d and 'title' in d['playlist']:
-                    playlist_state['playlist_name'] = d['playlist']['title']
-        
-        # Add playlist info to the progress data
-        if playlist_state['total_count'] > 0:
-            d['playlist_index'] = playlist_state['current_index'] + 1  # 1-based index
-            d['playlist_count'] = playlist_state['total_count']
-            d['playlist_name'] = playlist_state['playlist_name']
-            d['isPlaylist'] = True
-        
-        # Process progress through _on_progress
-        _on_progress(d, progress_callback)
-        
-        # Increment index for the next file
-        if (playlist_state['total_count'] > 0 and 
-            d.get('status') == 'finished' and 
-            playlist_state['current_index'] < playlist_state['total_count'] - 1):
-            playlist_state['current_index'] += 1
-    
-    # Base yt-dlp options
-    ydl_opts = {
-        "quiet": True,
-        "verbose": False,
-        "no_warnings": True,
-        "ignoreerrors": True,
-        "outtmpl": str(Path(output_dir) / f"%(title)s.%(ext)s"),
-        "noplaylist": not process_playlist,
-        "progress_hooks": [progress_wrapper],
-        "writethumbnail": True,  # Download thumbnail
-        "postprocessors": [],
-    }
-    
-    # Format selection logic
+    if progress_callback:
+        progress_callback = _debounce_progress(progress_callback)
+
+    # Playlist tracking state, read by the progress hook on every tick
+    playlist_state = _PlaylistState()
+    # Last reported position per file, used to drop ticks that barely moved
+    last_position = {}
+    progress_wrapper = functools.partial(_track_playlist_progress, playlist_state, progress_callback, last_position)
+
+    # Format selector, postprocessors and output template are worked out first,
+    # then ydl_opts is assembled in one go
+    postprocessors = []
     if format == 'mp4':
-        # Video resolution and FPS logic
-        height_filter = ""
-        fps_filter = ""
-        
-        if quality and quality.lower() != 'best':
-            # Remove 'p' if present (e.g. 1080p -> 1080)
-            height = quality.lower().replace('p', '')
-            if height.isdigit():
-                 height_filter = f"[height<={height}]"
-        
-        if fps and fps > 0:
-            # If FPS is specified, prefer formats with that FPS or higher
-            fps_filter = f"[fps>={fps}]"
-
-        if height_filter or fps_filter:
-            # Construct complex format selector
-            # Try to get best video matching criteria, fallback to best video without criteria if needed
-            ydl_opts["format"] = f"bestvideo{height_filter}{fps_filter}+bestaudio/best{height_filter}{fps_filter}/best"
-        else:
-            ydl_opts["format"] = "bestvideo+bestaudio/best"
-            
+        format_selector = _build_format_selector(format, quality, fps)
+        outtmpl = str(output_dir_path / "%(title)s.%(ext)s")
         # Ensure we merge into mp4
-        ydl_opts["merge_output_format"] = "mp4"
-        
-        # For MP4 we still want metadata
-        ydl_opts["postprocessors"].append({
+        format_opts = {"merge_output_format": "mp4"}
+
+        # For MP4 we still want metadata, and the embedded thumbnail
+        postprocessors.append({
             "key": "FFmpegMetadata",
             "add_metadata": True,
         })
-        
-        # And embed thumbnail
-        ydl_opts["postprocessors"].append({
+        postprocessors.append({
             "key": "EmbedThumbnail",
         })
 
     else:
         # Audio logic - Simplified to find best audio available, since we convert anyway
-        ydl_opts["format"] = "bestaudio/best"
-        ydl_opts["outtmpl"] = str(Path(output_dir) / f"%(title)s.{format}")  # Force the output extension
-    
-    if ffmpeg_path:
-        ydl_opts["ffmpeg_location"] = str(Path(ffmpeg_path).parent)
-        
-        # ONLY add audio conversion if NOT mp4
-        if format != 'mp4':
-            # 1. Convert to audio format (e.g., mp3)
-            ydl_opts["postprocessors"].append({
+        format_selector = _build_format_selector(format, quality, fps)
+        outtmpl = str(output_dir_path / f"%(title)s.{format}")  # Force the output extension
+        # Lets yt-dlp's already-downloaded check find the converted file
+        format_opts = {"final_ext": format}
+
+        # MP3 is handled by SingleShotFFmpegPP, registered on the YoutubeDL instance below
+        if format != 'mp3':
+            # 1. Convert to audio format (e.g., m4a)
+            postprocessors.append({
                 "key": "FFmpegExtractAudio",
                 "preferredcodec": format,
                 "preferredquality": str(bitrate),
             })
 
             # 2. Embed thumbnail (must be AFTER conversion)
-            ydl_opts["postprocessors"].append({
+            postprocessors.append({
                 "key": "EmbedThumbnail",
             })
-    else:
-        if format != 'mp4':
-            ydl_opts["format"] = "bestaudio[ext=m4a]/bestaudio"
 
-    output_path = None
+    ydl_opts = {
+        "quiet": True,
+        "verbose": False,
+        "no_warnings": True,
+        "ignoreerrors": True,
+        "format": format_selector,
+        "outtmpl": outtmpl,
+        "noplaylist": not process_playlist,
+        "progress_hooks": [progress_wrapper],
+        "writethumbnail": True,  # Download thumbnail
+        "postprocessors": postprocessors,
+        # The exact binary check_ffmpeg validated; yt-dlp finds ffprobe next to it
+        "ffmpeg_location": ffmpeg_path,
+        # Applied to every FFmpeg invocation, including SingleShotFFmpegPP
+        "postprocessor_args": {"ffmpeg": ["-threads", str(ffmpeg_threads)]},
+        # Fail fast on stuck hosts and back off between retries
+        "socket_timeout": timeout,
+        "retries": max_retries,
+        "fragment_retries": max_retries,
+        "retry_sleep_functions": RETRY_SLEEP_FUNCTIONS,
+        **format_opts,
+    }
+
+    final_path: Optional[Path] = None
     playlist_folder = None
+    playlist_name_sanitized = None
 
     info = None
+    ram_dir = None
     
     # Retry mechanism for download/update loop
     attempt = 0
@@ -390,16 +815,17 @@ def download_media(
             # Se è una playlist e process_playlist è True, crea una cartella con il nome della playlist
             if info and process_playlist and "entries" in info and info["entries"]:
                 playlist_title = info.get('title', info.get('playlist_title', 'Playlist'))
-                playlist_folder = Path(output_dir) / sanitize_filename(playlist_title)
+                playlist_name_sanitized = sanitize_filename(playlist_title)
+                playlist_folder = output_dir_path / playlist_name_sanitized
                 ensure_directory(str(playlist_folder))
                 
                 # Update playlist state for progress tracking
-                playlist_state['total_count'] = len([e for e in info['entries'] if e])
-                playlist_state['playlist_name'] = playlist_title
-                playlist_state['current_index'] = 1  # Start from 1 (1-based indexing)
+                playlist_state.total_count = len([e for e in info['entries'] if e])
+                playlist_state.playlist_name = playlist_title
+                playlist_state.current_index = 1  # Start from 1 (1-based indexing)
 
                 # Inizializza anche il calcolatore di progressi globale
-                set_playlist_info(playlist_state['total_count'], playlist_title)
+                set_playlist_info(playlist_state.total_count, playlist_title)
                 
                 # Aggiorna l'output template per salvare nella cartella della playlist
                 ydl_opts["outtmpl"] = str(playlist_folder / "%(title)s.%(ext)s")
@@ -410,7 +836,7 @@ def download_media(
                         "message": f"Playlist rilevata: {playlist_title}",
                         "playlist_name": playlist_title,
                         "playlist_folder": str(playlist_folder),
-                        "playlist_count": playlist_state['total_count']
+                        "playlist_count": playlist_state.total_count
                     })
             
             
@@ -418,29 +844,44 @@ def download_media(
             if progress_callback:
                 progress_callback({"status": "info", "message": "Starting download process..."})
                 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                try:
-                    info = ydl.extract_info(url, download=True)
-                except Exception as e:
-                    # Check for 403 or specific download errors to trigger update
-                    error_str = str(e)
-                    if "403" in error_str or "Forbidden" in error_str or "Sign in" in error_str or "Requested format" in error_str:
-                        # Only try to update and retry ONCE
-                        if not updated_once:
+            if use_ramdisk:
+                ram_dir = _ramdisk_dir(format, concurrency if playlist_folder else 1)
+                _stage_in_ramdisk(ydl_opts, ram_dir)
+
+            # Playlists resolve their flat entries one by one so downloads overlap with FFmpeg
+            pipelined = playlist_folder is not None
+            try:
+                if pipelined:
+                    info['entries'] = _download_playlist(info, ydl_opts, format, bitrate, progress_callback, concurrency)
+                else:
+                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                        if format == 'mp3':
+                            ydl.add_post_processor(SingleShotFFmpegPP(ydl, bitrate=bitrate, tags=_build_tags))
+                        if info and info.get('_type', 'video') == 'video':
+                            # The playlist probe already resolved this single video; don't fetch it again
+                            info = ydl.process_ie_result(info, download=True)
+                        else:
+                            info = ydl.extract_info(url, download=True)
+            except Exception as e:
+                # Check for 403 or specific download errors to trigger update
+                error_str = str(e)
+                if "403" in error_str or "Forbidden" in error_str or "Sign in" in error_str or "Requested format" in error_str:
+                    # Only try to update and retry ONCE
+                    if not updated_once:
+                        if progress_callback:
+                            progress_callback({"status": "info", "message": "Download error detected. Attempting to update yt-dlp..."})
+                        
+                        if update_ytdlp():
+                            updated_once = True
                             if progress_callback:
-                                progress_callback({"status": "info", "message": "Download error detected. Attempting to update yt-dlp..."})
-                            
-                            if update_ytdlp():
-                                updated_once = True
-                                if progress_callback:
-                                    progress_callback({"status": "info", "message": "yt-dlp updated. Retrying download..."})
-                                continue # Continue to next iteration of while loop (retry)
-                    
-                    if progress_callback:
-                        progress_callback({"status": "error", "message": f"Download failed: {str(e)}"})
-                    raise e # Re-raise if no update or update failed or already updated
+                                progress_callback({"status": "info", "message": "yt-dlp updated. Retrying download..."})
+                            continue # Continue to next iteration of while loop (retry)
+                
+                if progress_callback:
+                    progress_callback({"status": "error", "message": f"Download failed: {str(e)}"})
+                raise e # Re-raise if no update or update failed or already updated
 
-            
+        
             if info is None:
                 return False, None, "Impossibile scaricare il media"
 
@@ -448,82 +889,51 @@ def download_media(
             if "entries" in info and info["entries"]:
                 entries = info["entries"]
                 # Usa la cartella della playlist se disponibile, altrimenti output_dir
-                output_path = playlist_folder if playlist_folder else Path(output_dir)
+                final_path = playlist_folder if playlist_folder else output_dir_path
                 
-                # Process playlist files
-                for entry in entries:
-                    if not entry:
-                        continue
-                        
-                    # Get the downloaded file path
-                    if '_filename' in entry:
-                        downloaded_file = Path(entry['_filename'])
-                    elif 'requested_downloads' in entry and entry['requested_downloads']:
-                        downloaded_file = Path(entry['requested_downloads'][0]['filepath'])
-                    else:
-                        logger.warning(f"Could not determine file path for entry: {entry.get('title', 'Unknown')}")
-                        continue
-                    
-                    if not downloaded_file.exists():
-                        logger.warning(f"File not found: {downloaded_file}")
-                        continue
-                    
-                    # Rename the file using the video title
-                    title = entry.get('title', 'Unknown Title')
-                    new_name = sanitize_filename(title) + downloaded_file.suffix
-                    new_path = downloaded_file.parent / new_name
-                    
-                    try:
-                        # If the target file exists, remove it first (but only if it's different from source)
-                        if new_path != downloaded_file and new_path.exists():
-                            new_path.unlink()
-                        
-                        # Rename the file
-                        downloaded_file.rename(new_path)
-                        downloaded_file = new_path
-                        
-                        # Process metadata and add cover art
-                        if format.lower() == 'mp3' and downloaded_file.suffix.lower() == '.mp3':
-                            # Ensure we have all necessary metadata
-                            if 'webpage_url' not in entry and 'url' in info:
-                                entry['webpage_url'] = info['url']
-                            if 'uploader' not in entry and 'uploader' in info:
-                                entry['uploader'] = info['uploader']
-                            if 'artist' not in entry and 'artist' in info:
-                                entry['artist'] = info['artist']
-                            
-                            # Add playlist title as album if not set
-                            if 'album' not in entry and 'playlist' in info and info.get('playlist'):
-                                entry['album'] = info.get('playlist_title', 'YouTube Playlist')
-                            
-                            _process_metadata(downloaded_file, entry, progress_callback)
-                            # logger.info removed to avoid Unicode errors on Windows
-                            
-                    except Exception as e:
-                        logger.error(f"Error processing {downloaded_file}: {str(e)}", exc_info=True)
+                # Process playlist files (already done per entry when pipelined)
+                if not pipelined:
+                    entries = [e for e in entries if e]
+                    parent_thumbs = _thumbnail_index(entries)
+                    # Fetch the covers the metadata step will need concurrently, up front
+                    thumbnail_urls = [
+                        _pick_thumbnail(e, parent_thumbs) if format == 'mp3' and not _artwork_embedded(e) else None
+                        for e in entries
+                    ]
+                    artworks = download_artworks(thumbnail_urls)
+                    with ThreadPoolExecutor(max_workers=8) as pool:
+                        # Each entry renames and tags its own file, so they can overlap as well
+                        futures = [
+                            pool.submit(_finalize_playlist_entry, entry, info, format, progress_callback,
+                                        artwork, parent_thumbs)
+                            for entry, artwork in zip(entries, artworks)
+                        ]
+                        for future in futures:
+                            future.result()
                 
-                # Cleanup playlist residual thumbnails
                 # Cleanup playlist residual thumbnails
                 # Check both playlist folder and root output folder
                 folders_to_check = []
                 if playlist_folder and playlist_folder.exists():
                     folders_to_check.append(playlist_folder)
-                if output_dir and Path(output_dir).exists():
-                        folders_to_check.append(Path(output_dir))
+                if output_dir and output_dir_path.exists():
+                        folders_to_check.append(output_dir_path)
 
-                playlist_name_sanitized = sanitize_filename(info.get('title', ''))
+                if playlist_name_sanitized is None:
+                    playlist_name_sanitized = sanitize_filename(info.get('title', ''))
 
                 for folder in folders_to_check:
                     try:
-                        # Common extensions for thumbnails
-                        for ext in ['*.jpg', '*.jpeg', '*.png', '*.webp']:
-                            for thumb_file in folder.glob(ext):
+                        # One directory listing per folder; scandir needs no extra stat() calls
+                        with os.scandir(folder) as it:
+                            for dir_entry in it:
+                                stem, ext = os.path.splitext(dir_entry.name)
                                 # If the filename looks like the playlist name, delete it
-                                if thumb_file.stem == playlist_name_sanitized:
+                                if (stem == playlist_name_sanitized and ext.lower() in _THUMBNAIL_EXTS
+                                        and dir_entry.is_file()):
                                     try:
-                                        if thumb_file.exists():
-                                            thumb_file.unlink()
-                                            logger.info(f"Deleted playlist thumbnail: {thumb_file.name}")
+                                        os.unlink(dir_entry.path)
+                                        logger.info(f"Deleted playlist thumbnail: {dir_entry.name}")
                                     except OSError:
                                         pass
                     except Exception as e:
@@ -539,59 +949,39 @@ def download_media(
                     if not filepath:
                          return False, None, "Percorso file non disponibile nei metadati scaricati"
                          
-                    downloaded_file = Path(filepath).resolve()
+                    # Resolved once, at the return below
+                    downloaded_file = Path(filepath)
                     
                     # Post-processing per il file singolo
-                    if format.lower() == 'mp3' and (downloaded_file.suffix.lower() == '.mp3' or 
-                                                    (hasattr(download_info, 'ext') and download_info.ext.lower() == 'mp3')):
+                    if format == 'mp3' and not _artwork_embedded(info) and downloaded_file.suffix.lower() == '.mp3':
                         _process_metadata(downloaded_file, info, progress_callback)
                     
                     # Determina il nome finale del file
                     title = info.get('title', 'Unknown Title')
-                    ext = 'mp3' if format.lower() == 'mp3' else download_info.get('ext', format)
-                    output_path = Path(output_dir) / f"{sanitize_filename(title)}.{ext}"
+                    ext = 'mp3' if format == 'mp3' else download_info.get('ext', format)
+                    output_path = downloaded_file.with_name(f"{sanitize_filename(title)}.{ext}")
                     
                     # Se il file è stato convertito, rinominalo
-                    if downloaded_file.exists():
-                        try:
-                            # Ensure the output directory exists
-                            output_path.parent.mkdir(parents=True, exist_ok=True)
-                            
-                            # If the file is not already in the final location, move it
-                            if downloaded_file != output_path:
-                                if output_path.exists():
-                                    output_path.unlink()
-                                downloaded_file.rename(output_path)
-                        except Exception:
-                            # If moving fails, use the original downloaded file path
-                            output_path = downloaded_file
-                    else:
+                    # (os.replace overwrites an existing target atomically and
+                    # reports a missing source, so there is no exists() pre-check)
+                    try:
+                        if downloaded_file != output_path:
+                            os.replace(downloaded_file, output_path)
+                        elif not downloaded_file.exists():
+                            return False, None, "Il file scaricato non è stato trovato"
+                        final_path = output_path
+                    except FileNotFoundError:
                         return False, None, "Il file scaricato non è stato trovato"
+                    except OSError:
+                        # If moving fails, use the original downloaded file path
+                        final_path = downloaded_file
                 else:
                     return False, None, "Impossibile determinare il percorso del file scaricato"
 
-            if output_path and isinstance(output_path, (str, Path)):
-                output_path = Path(output_path).resolve()
-                if output_path.exists():
-                    return True, str(output_path), "Download completato con successo"
-                else:
-                    # If the file doesn't exist at the expected path, try to find it in the output directory
-                    title = info.get('title', 'Unknown Title')
-                    search_pattern = f"{sanitize_filename(title)}.*"
-                    matching_files = list(Path(output_dir).glob(search_pattern))
-                    if matching_files:
-                        return True, str(matching_files[0].resolve()), "Download completato con successo"
-                    return False, None, f"File non trovato nel percorso: {output_path}"
-            else:
-                # Try to get the output path from the info dict
-                if 'requested_downloads' in info and info['requested_downloads']:
-                    filepath = info['requested_downloads'][0].get('filepath')
-                    if filepath and Path(filepath).exists():
-                        return True, str(Path(filepath).resolve()), "Download completato con successo"
+            # final_path was captured where the file was produced and is known to exist
+            if final_path is None:
                 return False, None, "Impossibile determinare il percorso del file scaricato"
-                
-            # If we reached here successfully, break the retry loop
-            break
+            return True, str(final_path.resolve()), "Download completato con successo"
 
         except yt_dlp.utils.DownloadError as e:
             # Caught inside logic loop, but re-caught here if re-raised
@@ -607,40 +997,90 @@ def download_media(
             error_msg = str(e)
             logger.exception(f"Unexpected error: {error_msg}")
             return False, None, f"Errore imprevisto: {error_msg}"
+        finally:
+            if ram_dir:
+                shutil.rmtree(ram_dir, ignore_errors=True)
+                ram_dir = None
 
-def _on_progress(d: dict[str, Any], callback: Optional[Callable] = None) -> None:
+def _debounce_progress(callback: Callable, interval: float = 1 / 30) -> Callable:
+    """Limit 'downloading' updates to one per ``interval`` seconds.
+
+    The UI can't redraw faster than this, and every update is serialized to
+    JSON and written to the Electron pipe. Other statuses always go through,
+    and so do completed files: calculate_progress reports a finished playlist
+    entry that isn't the last one as 'downloading' with file_percent 100.
+    """
+    last_sent = [0.0]
+
+    def debounced(data):
+        if data.get('status') == 'downloading' and (data.get('file_percent') or 0) < 100:
+            now = time.monotonic()
+            if now - last_sent[0] < interval:
+                return
+            last_sent[0] = now
+        callback(data)
+
+    return debounced
+
+def _on_progress(
+    d: dict[str, Any],
+    callback: Optional[Callable] = None,
+    last_position: Optional[dict] = None
+) -> None:
     """Progress callback for yt-dlp.
     
     Args:
         d: Dictionary with progress information
         callback: Callback function to update download status
+        last_position: Last reported position per file; 'downloading' ticks
+            that moved less than half a percent (or 64 KiB when the size is
+            unknown) are skipped
     """
     if callback is None:
         return
 
     try:
+        dg = d.get  # Runs on every downloaded chunk
+        status = dg('status', '')
+        downloaded_bytes = int(dg('downloaded_bytes') or 0)
+        total_bytes = int(dg('total_bytes') or dg('total_bytes_estimate') or 0)
+        # Computed once as a float; total_bytes_estimate can undershoot, so cap it
+        percent = min(100.0, downloaded_bytes * 100.0 / total_bytes) if total_bytes else 0.0
+        filename = dg('filename', '')
+
+        if last_position is not None and status == 'downloading':
+            if total_bytes:
+                position, step = percent, 0.5
+            else:
+                position, step = downloaded_bytes, 64 * 1024
+            key = (filename, bool(total_bytes))
+            if position - last_position.get(key, -step) < step:
+                return
+            last_position[key] = position
+
+        # Special handling for finished status
+        if status == 'finished':
+            downloaded_bytes = total_bytes
+            percent = 100.0
+
         # Prepare progress data with consistent field names coming from yt-dlp
         progress_data = {
-            'status': d.get('status', ''),
-            'downloaded_bytes': int(d.get('downloaded_bytes', 0) or 0),
-            'total_bytes': int((d.get('total_bytes') or d.get('total_bytes_estimate') or 0)),
-            'speed': d.get('speed', 0),
-            'eta': d.get('eta', 0),
-            'filename': d.get('filename', ''),
-            '_percent_str': d.get('_percent_str', '0%'),
-            '_speed_str': d.get('_speed_str', '0 B/s'),
-            '_eta_str': d.get('_eta_str', '--:--'),
+            'status': status,
+            'downloaded_bytes': downloaded_bytes,
+            'total_bytes': total_bytes,
+            'percent': percent,
+            'speed': dg('speed', 0),
+            'eta': dg('eta', 0),
+            'filename': filename,
+            '_percent_str': '%.1f%%' % percent,
+            '_speed_str': dg('_speed_str', '0 B/s'),
+            '_eta_str': dg('_eta_str', '--:--'),
             # Playlist fields (se presenti)
-            'playlist_index': d.get('playlist_index'),
-            'playlist_count': d.get('playlist_count'),
-            'playlist_name': d.get('playlist_name'),
+            'playlist_index': dg('playlist_index'),
+            'playlist_count': dg('playlist_count'),
+            'playlist_name': dg('playlist_name'),
         }
 
-        # Special handling for finished status
-        if progress_data['status'] == 'finished':
-            progress_data['downloaded_bytes'] = progress_data['total_bytes']
-            progress_data['_percent_str'] = '100%'
-
         # Usa il ProgressCalculator per calcolare file_percent / playlist_percent / percentage
         enriched_progress = calculate_progress(progress_data)
 
@@ -649,7 +1089,8 @@ def _on_progress(d: dict[str, Any], callback: Optional[Callable] = None) -> None
             callback(enriched_progress)
             
     except Exception as e:
-        logger.warning(f"Error in progress callback: {str(e)}", exc_info=True)
+        # Formatting the traceback is costly and this can fire on every tick
+        logger.warning(f"Error in progress callback: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
         # Send error status to frontend
         if callable(callback):
             try:
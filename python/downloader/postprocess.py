@@ -6,63 +6,395 @@ after the initial download and conversion process. It includes features for
 adding metadata, downloading album art, and other post-processing tasks.
 """
 import io
+import os
+import json
+import hashlib
 import logging
+import functools
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Callable, Dict, Any, List, Tuple
 
-import mutagen
 import requests
-from mutagen.id3 import ID3, APIC, TIT2, TPE1, TALB, TPE2, TRCK, TYER, TCON, COMM
-from mutagen.mp3 import EasyMP3
-from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    # Optional Rust-backed drop-in for mutagen, much faster at reading and writing tags
+    import mutagen_rs as mutagen
+    from mutagen_rs.id3 import ID3, APIC, TIT2, TPE1, TALB, TPE2, TRCK, TYER, TCON, COMM
+except ImportError:
+    import mutagen
+    from mutagen.id3 import ID3, APIC, TIT2, TPE1, TALB, TPE2, TRCK, TYER, TCON, COMM
+try:
+    # Optional in-process libav bindings: encode without spawning ffmpeg per file
+    import av
+except ImportError:
+    av = None
+from yt_dlp.postprocessor import FFmpegPostProcessor
+from yt_dlp.utils import PostProcessingError, prepend_extension, replace_extension
+
+from .config import CACHE_DIR, ARTWORK_CACHE_MAX_BYTES
 
 logger = logging.getLogger(__name__)
 
-def download_artwork(url: str) -> Optional[bytes]:
-    """Download artwork from a URL."""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, timeout=10, headers=headers)
-        response.raise_for_status()
-        
-        content_type = response.headers.get('content-type', '').lower()
-        if not content_type.startswith('image/'):
-            logger.warning(f"URL does not seem to point to an image (Content-Type: {content_type})")
-        
-        img_bytes = response.content
-
-        # Verify image validity
+# Key set on the info dict once the single-shot pass has embedded the cover
+ARTWORK_EMBEDDED_KEY = 'audit_artwork_embedded'
+
+# Maps the keyword arguments of set_mp3_metadata to FFmpeg metadata keys
+_FFMPEG_TAG_KEYS = {
+    'title': 'title',
+    'artist': 'artist',
+    'album': 'album',
+    'album_artist': 'album_artist',
+    'track_number': 'track',
+    'year': 'date',
+    'genre': 'genre',
+    'comment': 'comment',
+}
+
+
+class SingleShotFFmpegPP(FFmpegPostProcessor):
+    """Convert to MP3, embed the cover and write ID3 tags in one FFmpeg run.
+
+    Replaces the FFmpegExtractAudio -> EmbedThumbnail -> FFmpegMetadata chain,
+    which re-reads and re-writes the whole file once per step. When PyAV is
+    installed the file is encoded in process instead, with no ffmpeg spawn.
+    """
+
+    def __init__(self, downloader=None, bitrate: int = 320,
+                 tags: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+        super().__init__(downloader)
+        self._bitrate = bitrate
+        self._tags = tags
+
+    def run(self, info):
+        source = info['filepath']
+        target = replace_extension(source, 'mp3')
+        temp = prepend_extension(target, 'temp')
+
+        # Thumbnail written by 'writethumbnail' (last one with a file on disk)
+        thumbnails = info.get('thumbnails') or []
+        thumb = next((t for t in reversed(thumbnails)
+                      if t.get('filepath') and os.path.exists(t['filepath'])), None)
+        tags = self._tags(info) if self._tags else {}
+
+        if av is not None and self._run_in_process(source, temp, thumb, tags):
+            os.replace(temp, target)
+            return self._finish(info, source, target, thumb)
+
+        inputs = [source]
+        opts = ['-map', '0:a:0', '-c:a', 'libmp3lame', '-b:a', f'{self._bitrate}k']
+        if thumb:
+            inputs.append(thumb['filepath'])
+            opts += [
+                '-map', '1:v:0', '-c:v', 'mjpeg', '-disposition:v', 'attached_pic',
+                '-metadata:s:v', 'title=Album cover', '-metadata:s:v', 'comment=Cover (front)',
+            ]
+        opts += ['-id3v2_version', '3', '-write_id3v1', '1']
+
+        for name, value in tags.items():
+            key = _FFMPEG_TAG_KEYS.get(name)
+            if key and value:
+                opts += ['-metadata', f'{key}={value}']
+
+        self.to_screen(f'Converting, tagging and embedding cover into "{target}"')
         try:
-            img = Image.open(io.BytesIO(img_bytes))
-            img.verify()
-        except Exception:
-            return None
+            self.run_ffmpeg_multiple_files(inputs, temp, opts)
+        except Exception as e:
+            raise PostProcessingError(f'Single-shot FFmpeg pass failed: {e}')
+        os.replace(temp, target)
+        return self._finish(info, source, target, thumb)
 
-        # Reopen and normalize the image
-        img = Image.open(io.BytesIO(img_bytes))
-        if img.mode in ("RGBA", "P", "LA"):
-            background = Image.new("RGB", img.size, (255, 255, 255))
-            img = img.convert("RGBA")
-            background.paste(img, mask=img.split()[-1])
-            img = background
+    def _run_in_process(self, source, temp, thumb, tags) -> bool:
+        """Encode with PyAV and tag with mutagen; False if the FFmpeg run is needed instead."""
+        self.to_screen(f'Converting "{source}" in process')
+        try:
+            _encode_mp3(source, temp, self._bitrate)
+            artwork = None
+            if thumb:
+                with open(thumb['filepath'], 'rb') as f:
+                    artwork = _normalize_artwork(f.read())
+                if artwork is None:
+                    raise PostProcessingError('Unreadable thumbnail')
+            if not set_mp3_metadata(file_path=Path(temp), artwork=artwork, **tags):
+                raise PostProcessingError('Unable to write tags')
+        except Exception as e:
+            logger.warning(f"In-process conversion failed, falling back to FFmpeg: {str(e)}")
+            if os.path.exists(temp):
+                os.remove(temp)
+            return False
+        return True
 
-        # Resize large thumbnails
-        if img.width > 1000 or img.height > 1000:
-            img.thumbnail((1000, 1000), Image.Resampling.LANCZOS)
+    def _finish(self, info, source, target, thumb):
+        """Update the info dict and list the source and thumbnail for deletion."""
+        files_to_delete = [] if source == target else [source]
+        if thumb:
+            files_to_delete.append(thumb.pop('filepath'))
 
-        # Save as high-quality JPEG
-        buf = io.BytesIO()
-        img.save(buf, format="JPEG", quality=95)
-        return buf.getvalue()
+        info['filepath'] = target
+        info['ext'] = 'mp3'
+        info[ARTWORK_EMBEDDED_KEY] = thumb is not None
+        return files_to_delete, info
 
+
+def _encode_mp3(source: str, target: str, bitrate: int) -> None:
+    """Decode the first audio stream of ``source`` and encode it to MP3 with libmp3lame."""
+    with av.open(source) as in_container, av.open(target, 'w', format='mp3') as out_container:
+        in_stream = in_container.streams.audio[0]
+        # libmp3lame tops out at 48 kHz; the encoder resamples frames as needed
+        out_stream = out_container.add_stream('libmp3lame', rate=min(in_stream.rate or 44100, 48000))
+        out_stream.bit_rate = bitrate * 1000
+        for frame in in_container.decode(in_stream):
+            frame.pts = None
+            for packet in out_stream.encode(frame):
+                out_container.mux(packet)
+        for packet in out_stream.encode(None):
+            out_container.mux(packet)
+
+
+def _create_session() -> requests.Session:
+    """Create the HTTP session shared by artwork downloads (keep-alive, pooled connections)."""
+    session = requests.Session()
+    # Transient CDN errors are retried on the pooled connection with a short back-off
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    )
+    return session
+
+_SESSION = _create_session()
+
+def download_artwork(url: str, session: Optional[requests.Session] = None) -> Optional[bytes]:
+    """Download artwork from a URL.
+
+    Uses the module-wide session unless another one is given, so repeated
+    downloads from the same CDN reuse the TCP/TLS connection. Results fetched
+    through the shared session are cached per URL (playlist entries often
+    share a cover). Covers are also kept on disk under ``CACHE_DIR/artwork``
+    and revalidated with a conditional request on later runs.
+    """
+    try:
+        if session is None:
+            return _fetch_artwork_cached(url)
+        return _fetch_artwork(url, session)
     except requests.RequestException:
         return None
     except Exception:
         return None
 
 
+def download_artworks(urls: List[Optional[str]], max_workers: int = 6) -> List[Optional[bytes]]:
+    """Download several covers concurrently; the result lines up with ``urls``.
+
+    Repeated URLs are fetched once and empty ones give None. ``max_workers``
+    stays modest so the CDN doesn't start resetting connections.
+    """
+    unique = [url for url in dict.fromkeys(urls) if url]
+    if not unique:
+        return [None] * len(urls)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique)), thread_name_prefix="artwork") as pool:
+        artworks = dict(zip(unique, pool.map(download_artwork, unique)))
+    return [artworks.get(url) if url else None for url in urls]
+
+
+# Normalized covers are at most ~0.5 MB, so this stays well under 64 MB
+@functools.lru_cache(maxsize=128)
+def _fetch_artwork_cached(url: str) -> bytes:
+    # Failures raise, so they are not cached
+    return _fetch_artwork(url, _SESSION)
+
+
+# Covers are a few hundred KB; anything far larger is not worth holding in memory
+_ARTWORK_MAX_BYTES = 8 * 1024 * 1024
+
+# Content types served for images by CDNs that don't label them properly
+_GENERIC_CONTENT_TYPES = ('', 'application/octet-stream', 'binary/octet-stream')
+
+
+def _fetch_artwork(url: str, session: requests.Session) -> bytes:
+    cached, validators = _load_cached_artwork(url)
+    # The URL that actually served the cover (hqdefault when maxres was missing)
+    source = validators.pop('source', url)
+    headers = validators if cached is not None else {}
+
+    # Streamed, so the body is only read once the headers look like an image
+    response = session.get(source, timeout=10, stream=True, headers=headers)
+    if response.status_code == 304:
+        response.close()
+        _touch_cached_artwork(url)
+        return cached
+    if response.status_code == 404 and source.endswith('/maxresdefault.jpg'):
+        # Older YouTube videos have no maxres thumbnail
+        response.close()
+        source = source[:-len('maxresdefault.jpg')] + 'hqdefault.jpg'
+        response = session.get(source, timeout=10, stream=True)
+    with response:
+        response.raise_for_status()
+
+        content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+        if not content_type.startswith('image/') and content_type not in _GENERIC_CONTENT_TYPES:
+            raise ValueError(f"URL does not point to an image (Content-Type: {content_type}): {url}")
+        content = _read_capped(response, url)
+
+    artwork = _normalize_artwork(content)
+    if artwork is None:
+        raise ValueError(f"Not a valid image: {url}")
+    _save_cached_artwork(url, artwork, source, response.headers)
+    return artwork
+
+
+def _read_capped(response: requests.Response, url: str) -> bytes:
+    """Read a streamed response body, giving up past _ARTWORK_MAX_BYTES."""
+    length = response.headers.get('content-length')
+    if length and length.isdigit() and int(length) > _ARTWORK_MAX_BYTES:
+        raise ValueError(f"Artwork too large ({length} bytes): {url}")
+    buf = io.BytesIO()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        buf.write(chunk)
+        if buf.tell() > _ARTWORK_MAX_BYTES:
+            raise ValueError(f"Artwork too large (over {_ARTWORK_MAX_BYTES} bytes): {url}")
+    return buf.getvalue()
+
+
+_ARTWORK_CACHE_DIR = CACHE_DIR / "artwork"
+# The size bound is enforced once per process, on the first cover saved
+_artwork_cache_pruned = False
+
+
+def _artwork_cache_paths(url: str) -> Tuple[Path, Path]:
+    """Return the cached image and its validators file for a URL."""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return _ARTWORK_CACHE_DIR / f"{key}.jpg", _ARTWORK_CACHE_DIR / f"{key}.json"
+
+
+def _load_cached_artwork(url: str) -> Tuple[Optional[bytes], Dict[str, str]]:
+    """Return the cover saved by a previous run and the headers to revalidate it with."""
+    image_path, meta_path = _artwork_cache_paths(url)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(image_path, 'rb') as f:
+            artwork = f.read()
+    except (OSError, ValueError):
+        return None, {}
+
+    validators = {'source': meta.get('source') or url}
+    if meta.get('etag'):
+        validators['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        validators['If-Modified-Since'] = meta['last_modified']
+    if len(validators) == 1:
+        # Nothing to revalidate with: fetch it again
+        return None, validators
+    return artwork, validators
+
+
+def _save_cached_artwork(url: str, artwork: bytes, source: str, headers) -> None:
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    image_path, meta_path = _artwork_cache_paths(url)
+    meta = {'source': source, 'etag': etag, 'last_modified': last_modified}
+    try:
+        _ARTWORK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Written to a temp file first: concurrent workers may save the same cover
+        for path, data in ((image_path, artwork), (meta_path, json.dumps(meta).encode('utf-8'))):
+            fd, temp = tempfile.mkstemp(dir=_ARTWORK_CACHE_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp, path)
+    except OSError as e:
+        logger.debug(f"Could not cache artwork for {url}: {e}")
+        return
+
+    global _artwork_cache_pruned
+    if not _artwork_cache_pruned:
+        _artwork_cache_pruned = True
+        _prune_artwork_cache()
+
+
+def _touch_cached_artwork(url: str) -> None:
+    """Mark a cached cover as recently used, so pruning keeps it."""
+    try:
+        os.utime(_artwork_cache_paths(url)[0])
+    except OSError:
+        pass
+
+
+def _prune_artwork_cache() -> None:
+    """Delete the least recently used covers until the cache fits ARTWORK_CACHE_MAX_BYTES."""
+    try:
+        with os.scandir(_ARTWORK_CACHE_DIR) as it:
+            images = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in it
+                      if e.name.endswith('.jpg') and e.is_file()]
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in images)
+    for _, size, path in sorted(images):
+        if total <= ARTWORK_CACHE_MAX_BYTES:
+            break
+        for stale in (path, path[:-len('.jpg')] + '.json'):
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+        total -= size
+
+
+def _normalize_artwork(img_bytes: bytes) -> Optional[bytes]:
+    """Validate an image and re-encode it as an RGB JPEG no larger than 1000px.
+
+    JPEGs that already fit are returned as they are (the header is parsed, the
+    pixels are not decoded). Anything else is decoded once; invalid data fails
+    that decode, so there is no separate verify() pass.
+    """
+    # Imported here: Pillow is only needed once a cover has to be re-encoded
+    from PIL import Image
+
+    try:
+        img = Image.open(io.BytesIO(img_bytes))
+        if img.format == "JPEG" and img.mode == "RGB" and max(img.size) <= 1000:
+            return img_bytes
+        longest = max(img.size)
+        if longest > 1000:
+            # Let libjpeg decode large JPEGs at 1/2, 1/4 or 1/8 scale, keeping at
+            # least twice the final size for LANCZOS, like thumbnail() does on an
+            # image that isn't loaded yet (no-op for other formats)
+            img.draft("RGB", tuple(d * 2000 // longest for d in img.size))
+        img.load()
+    except Exception:
+        return None
+
+    # Palette and grayscale images can't be resampled with LANCZOS; widen them first
+    if img.mode in ("P", "LA"):
+        img = img.convert("RGBA")
+    elif img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+
+    # Resize large thumbnails before compositing, so the paste touches fewer pixels
+    if img.width > 1000 or img.height > 1000:
+        img.thumbnail((1000, 1000), Image.Resampling.LANCZOS)
+
+    # Flatten transparency onto white
+    if img.mode == "RGBA":
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        img = background
+
+    # Quality 85 with optimized Huffman tables looks the same as 95 for cover
+    # art at a much smaller size; the bytes end up in every tagged file
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=85, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
 def set_mp3_metadata(
     file_path: Path,
     title: str = "",
@@ -128,7 +460,9 @@ def set_mp3_metadata(
             if comment:
                 tags.add(COMM(encoding=3, text=comment, lang='eng', desc=''))
             
-            logger.debug(f"Tags to save: {tags.pprint()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                # pprint() walks every frame; only build it when it is logged
+                logger.debug(f"Tags to save: {tags.pprint()}")
             
             # Save all tags
             tags.save(file_str, v2_version=3)
@@ -7,7 +7,7 @@ providing accurate download progress and status information to the UI.
 
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, ClassVar
+from typing import Dict, Any, Optional, ClassVar, Set
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -20,6 +20,11 @@ class ProgressState:
     is_playlist_mode: bool = False
     playlist_name: str = ""
     completed_songs: int = 0
+    # Playlist entries can download concurrently: fraction done (0-1) of each
+    # entry still downloading, keyed by playlist index
+    active: Dict[int, float] = field(default_factory=dict)
+    # Playlist indexes already counted in completed_songs
+    finished: Set[int] = field(default_factory=set)
 
 class ProgressCalculator:
     """
@@ -56,61 +61,74 @@ class ProgressCalculator:
         )
         logger.info("Playlist mode: %d songs, name: %s", total_songs, playlist_name)
     
-    def _calculate_file_percent(self, progress_data: Dict[str, Any], 
-                             downloaded_bytes: int, total_bytes: int) -> float:
+    def _calculate_file_percent(self, progress_data: Dict[str, Any]) -> float:
         """Calculate the download percentage of the current file.
         
         Args:
-            progress_data: Raw progress data from yt-dlp
-            downloaded_bytes: Number of bytes downloaded
-            total_bytes: Total size of the file in bytes
+            progress_data: Progress data from core._on_progress, which carries
+                the percentage computed from the byte counts
             
         Returns:
             float: Download percentage (0.0-100.0)
         """
-        # Try to extract percentage from yt-dlp's string
-        percent_str = str(progress_data.get('_percent_str', '0%')).strip('%')
-        try:
-            return min(100.0, max(0.0, float(percent_str)))
-        except (ValueError, TypeError):
-            # Fallback to byte-based calculation
-            if total_bytes > 0:
-                return min(100.0, max(0.0, (downloaded_bytes / total_bytes) * 100))
-            return 0.0
+        percent = progress_data.get('percent')
+        if percent is None:
+            total_bytes = progress_data.get('total_bytes') or 0
+            if total_bytes <= 0:
+                return 0.0
+            percent = (progress_data.get('downloaded_bytes') or 0) * 100.0 / total_bytes
+        # Conditional clamp: cheaper than min(max()) on every progress tick
+        return 0.0 if percent < 0.0 else 100.0 if percent > 100.0 else percent
     
-    def _calculate_playlist_progress(self, file_percent: float) -> float:
+    def _calculate_playlist_progress(self) -> float:
         """Calculate the overall playlist progress.
         
-        Args:
-            file_percent: Current file's download percentage (0-100)
-            
+        Completed entries count as whole songs and every entry still
+        downloading adds its own fraction, so concurrent downloads don't make
+        the total jump between files.
+        
         Returns:
             float: Overall playlist progress (0.0-100.0)
         """
-        if not self._state.is_playlist_mode or self._state.total_songs == 0:
+        state = self._state
+        if not state.is_playlist_mode or state.total_songs == 0:
             return 0.0
             
-        total_progress = (self._state.completed_songs + (file_percent / 100.0))
-        return min(100.0, max(0.0, (total_progress / self._state.total_songs) * 100))
+        total_progress = state.completed_songs + sum(state.active.values())
+        percent = (total_progress / state.total_songs) * 100
+        return 0.0 if percent < 0.0 else 100.0 if percent > 100.0 else percent
     
-    def _handle_finished_status(self) -> Dict[str, float]:
+    def _handle_finished_status(self, index_known: bool) -> Dict[str, float]:
         """Handle status when a download finishes.
         
+        Args:
+            index_known: Whether the tick carried its playlist index; if not,
+                the next tick is assumed to belong to the next entry
+        
         Returns:
-            Tuple of (status, file_percent, playlist_percent, main_percentage)
+            Dict with status, file_percent, playlist_percent and percentage
         """
-        if not self._state.is_playlist_mode:
+        state = self._state
+        if not state.is_playlist_mode:
             return {'status': 'finished', 'file_percent': 100.0, 'playlist_percent': 100.0, 'percentage': 100.0}
         
-        if self._state.completed_songs < self._state.total_songs - 1:
+        index = state.current_index
+        state.active.pop(index, None)
+        # Entries downloaded in parts (e.g. video and audio of an mp4) finish more than once
+        if index not in state.finished:
+            state.finished.add(index)
+            state.completed_songs += 1
+        if not index_known:
+            state.current_index += 1
+        
+        if state.completed_songs < state.total_songs:
             # Not the last song in playlist
-            self._state.completed_songs += 1
-            self._state.current_index += 1
+            playlist_percent = self._calculate_playlist_progress()
             return {
                 'status': 'downloading',
                 'file_percent': 100.0,
-                'playlist_percent': self._calculate_playlist_progress(100.0),
-                'percentage': self._calculate_playlist_progress(100.0)
+                'playlist_percent': playlist_percent,
+                'percentage': playlist_percent
             }
         
         # Last song completed
@@ -133,37 +151,40 @@ class ProgressCalculator:
         status = progress_data.get('status', 'ready')
         
         # Calculate file-level progress
-        file_percent = self._calculate_file_percent(
-            progress_data,
-            progress_data.get('downloaded_bytes', 0),
-            progress_data.get('total_bytes', 0)
-        )
+        file_percent = self._calculate_file_percent(progress_data)
+        
+        # The tick's own playlist index says which entry it belongs to
+        state = self._state
+        index = progress_data.get('playlist_index')
+        if state.is_playlist_mode and index:
+            state.current_index = index
         
         # Handle finished status
         if status == 'finished':
-            progress = self._handle_finished_status()
+            result = self._handle_finished_status(bool(index))
         else:
-            progress = {
+            if state.is_playlist_mode and state.current_index not in state.finished:
+                state.active[state.current_index] = file_percent / 100.0
+            playlist_percent = self._calculate_playlist_progress()
+            result = {
                 'status': status,
                 'file_percent': file_percent,
-                'playlist_percent': self._calculate_playlist_progress(file_percent),
-                'percentage': (self._calculate_playlist_progress(file_percent) 
-                             if self._state.is_playlist_mode else file_percent)
+                'playlist_percent': playlist_percent,
+                'percentage': playlist_percent if state.is_playlist_mode else file_percent
             }
         
-        # Build result dictionary
-        result = {
-            **progress,
-            'downloaded_bytes': progress_data.get('downloaded_bytes', 0),
-            'total_bytes': progress_data.get('total_bytes', 0),
-            'speed': progress_data.get('speed', 0),
-            'eta': progress_data.get('eta', 0),
-            'filename': progress_data.get('filename', ''),
-            'currentFile': progress_data.get('filename', ''),
-            '_percent_str': progress_data.get('_percent_str', ''),
-            '_speed_str': progress_data.get('_speed_str', ''),
-            '_eta_str': progress_data.get('_eta_str', '')
-        }
+        # Fill in the rest of the result in place (no intermediate dict to merge)
+        get = progress_data.get
+        filename = get('filename', '')
+        result['downloaded_bytes'] = get('downloaded_bytes', 0)
+        result['total_bytes'] = get('total_bytes', 0)
+        result['speed'] = get('speed', 0)
+        result['eta'] = get('eta', 0)
+        result['filename'] = filename
+        result['currentFile'] = filename
+        result['_percent_str'] = get('_percent_str', '')
+        result['_speed_str'] = get('_speed_str', '')
+        result['_eta_str'] = get('_eta_str', '')
         
         # Add playlist info if in playlist mode
         if self._state.is_playlist_mode:
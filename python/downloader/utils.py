@@ -21,23 +21,36 @@ Dependencies:
 """
 import re
 import logging
+import functools
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# One C-level pass: invalid characters become '_', control characters are dropped
+_SANITIZE_TABLE = str.maketrans({
+    **{c: '_' for c in '\\/*?:"<>|'},
+    **{c: None for c in range(0x00, 0x20)},
+    **{c: None for c in range(0x7f, 0xa0)},
+})
+_WHITESPACE_RE = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=1024)
 def sanitize_filename(filename: str) -> str:
-    """Sanitize a string to be used as a filename."""
+    """Sanitize a string to be used as a filename.
+
+    Cached: the same titles are sanitized again by the rename, metadata and
+    cleanup steps.
+    """
     if not filename:
         return 'unnamed_file'
         
-    # Remove invalid characters
-    filename = re.sub(r'[\\/*?:"<>|]', '_', filename)
-    filename = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', filename)
+    # Replace invalid characters and remove control characters
+    filename = filename.translate(_SANITIZE_TABLE)
     
     # Clean up the filename
     filename = filename.strip('. ')
-    filename = re.sub(r'\s+', ' ', filename).strip()
+    filename = _WHITESPACE_RE.sub(' ', filename).strip()
     
     # Ensure the filename is a reasonable length
     if not filename:
@@ -52,12 +65,18 @@ def parse_eta_to_seconds(eta_str: str) -> int:
     if not eta_str or eta_str == 'N/A':
         return 0
     try:
-        parts = list(map(int, eta_str.split(':')))
-        if len(parts) == 3:
-            return parts[0] * 3600 + parts[1] * 60 + parts[2]
-        elif len(parts) == 2:
-            return parts[0] * 60 + parts[1]
-        return parts[0]
+        # partition() instead of split(): no list is built on every progress tick
+        first, sep, rest = eta_str.partition(':')
+        if not sep:
+            return int(first)
+        second, sep, third = rest.partition(':')
+        if sep:
+            if ':' in third:
+                # Four or more fields (never sent by yt-dlp): every field must
+                # be a number and the first one is returned, as before
+                return list(map(int, eta_str.split(':')))[0]
+            return int(first) * 3600 + int(second) * 60 + int(third)
+        return int(first) * 60 + int(second)
     except (ValueError, AttributeError):
         return 0
 
@@ -2,4 +2,4 @@
 Interface modules for the YouTube to MP3 downloader.
 """
 
-__all__ = ['ipc', 'log', 'args_parser']
+__all__ = ['ipc', 'log', 'args_parser', 'serialization']
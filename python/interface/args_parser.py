@@ -20,6 +20,7 @@ Dependencies:
 - config.py: For default configuration values
 """
 import argparse
+import functools
 import json
 import sys
 from pathlib import Path
@@ -32,16 +33,25 @@ except ImportError:
     # For direct script execution
     from ..downloader import config
 
-def parse_arguments(args: Optional[List[str]] = None) -> Dict[str, Any]:
-    """
-    Parse command line arguments.
-    
-    Args:
-        args: List of command line arguments. If None, uses sys.argv[1:].
-        
-    Returns:
-        Dictionary of parsed arguments.
-    """
+from . import serialization
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts where 0 is meaningful (e.g. FFmpeg's automatic thread count)."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer, got {value}")
+    return number
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (once per process; parse_args doesn't modify it)."""
     parser = argparse.ArgumentParser(description="YouTube to MP3 Converter")
     
     # Required arguments
@@ -100,6 +110,26 @@ def parse_arguments(args: Optional[List[str]] = None) -> Dict[str, Any]:
         help=f"Maximum number of retry attempts (default: {config.DEFAULT_MAX_RETRIES})"
     )
     
+    parser.add_argument(
+        "--concurrent-downloads",
+        type=_positive_int,
+        default=None,
+        help="Number of playlist entries downloaded and converted in parallel (default: min(CPU count, 4))"
+    )
+    
+    parser.add_argument(
+        "--ffmpeg-threads",
+        type=_non_negative_int,
+        default=None,
+        help="Threads per FFmpeg invocation, 0 lets FFmpeg decide (default: CPU count divided among concurrent downloads)"
+    )
+    
+    parser.add_argument(
+        "--ramdisk",
+        action="store_true",
+        help="Keep intermediate files on a RAM disk (/dev/shm) when there is enough free memory"
+    )
+    
     parser.add_argument(
         "--fps",
         type=int,
@@ -119,8 +149,20 @@ def parse_arguments(args: Optional[List[str]] = None) -> Dict[str, Any]:
         help="Path to log file (default: None, logs to console only)"
     )
 
+    return parser
+
+def parse_arguments(args: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Parse command line arguments.
+    
+    Args:
+        args: List of command line arguments. If None, uses sys.argv[1:].
+        
+    Returns:
+        Dictionary of parsed arguments.
+    """
     # Parse arguments
-    parsed_args = parser.parse_args(args)
+    parsed_args = _build_parser().parse_args(args)
     
     # Convert to dictionary and add any additional processing
     args_dict = {
@@ -134,6 +176,9 @@ def parse_arguments(args: Optional[List[str]] = None) -> Dict[str, Any]:
         'process_playlist': parsed_args.process_playlist,
         'timeout': parsed_args.timeout,
         'max_retries': parsed_args.max_retries,
+        'use_ramdisk': parsed_args.ramdisk,
+        'concurrency': parsed_args.concurrent_downloads,
+        'ffmpeg_threads': parsed_args.ffmpeg_threads,
         'log_level': parsed_args.log_level,
         'log_file': parsed_args.log_file
     }
@@ -151,7 +196,7 @@ def parse_json_input(json_input: str) -> Dict[str, Any]:
         Dictionary of parsed arguments
     """
     try:
-        data = json.loads(json_input)
+        data = serialization.loads(json_input)
         
         # Convert to the same format as CLI args
         quality = data.get('quality', str(config.DEFAULT_BITRATE))
@@ -161,6 +206,19 @@ def parse_json_input(json_input: str) -> Dict[str, Any]:
         if fmt in ['mp3', 'm4a', 'flac', 'wav', 'opus'] and str(quality).isdigit():
             bitrate = int(quality)
 
+        concurrency = data.get('concurrent_downloads')
+        if concurrency is not None:
+            concurrency = int(concurrency)
+            if concurrency < 1:
+                raise ValueError(f"concurrent_downloads must be at least 1, got {concurrency}")
+
+        # 0 is a valid value (FFmpeg picks the thread count), so test for None rather than truthiness
+        ffmpeg_threads = data.get('ffmpeg_threads')
+        if ffmpeg_threads is not None:
+            ffmpeg_threads = int(ffmpeg_threads)
+            if ffmpeg_threads < 0:
+                raise ValueError(f"ffmpeg_threads must be 0 or more, got {ffmpeg_threads}")
+
         return {
             'url': data.get('url'),
             'output_folder': Path(data.get('output_folder', str(config.DEFAULT_OUTPUT_DIR))).resolve(),
@@ -171,6 +229,9 @@ def parse_json_input(json_input: str) -> Dict[str, Any]:
             'process_playlist': bool(data.get('process_playlist', False)),
             'timeout': int(data.get('timeout', config.DEFAULT_TIMEOUT)),
             'max_retries': int(data.get('max_retries', config.DEFAULT_MAX_RETRIES)),
+            'use_ramdisk': bool(data.get('use_ramdisk', False)),
+            'concurrency': concurrency,
+            'ffmpeg_threads': ffmpeg_threads,
             'log_level': data.get('log_level', 'INFO'),
             'log_file': data.get('log_file')
         }
@@ -194,4 +255,4 @@ def format_result(success: bool, message: str, output_path: Optional[Union[str,
         'message': message,
         'output_path': str(output_path) if output_path else None
     }
-    return json.dumps(result)
\ No newline at end of file
+    return serialization.dumps(result).decode('utf-8')
\ No newline at end of file
@@ -6,6 +6,7 @@ import logging
 from typing import Any, Callable, Dict, Optional, Union
 
 from .log import ProgressReporter, format_progress, setup_logging
+from .serialization import loads as json_loads, write_message
 from downloader.progress import ProgressCalculator
 
 # Configure root logging once and get a module-specific logger
@@ -51,7 +52,7 @@ class IPC:
             
             # Always write to stdout as single-line JSON for Electron
             # Prepend \n to ensure it's on a new line even if yt-dlp printed without newline
-            print('\n' + json.dumps(message), flush=True)
+            write_message(message, leading_newline=True)
             
             # Also log to stderr for debugging (won't interfere with JSON parsing)
             status = progress_data.get('status', 'unknown')
@@ -69,7 +70,7 @@ class IPC:
                 'type': 'error',
                 'message': f'Error formatting progress: {str(e)}'
             }
-            print(json.dumps(error_message), flush=True)
+            write_message(error_message)
             logger.error(f"Progress handler error: {e}", exc_info=True)
     
     def send_result(self, success: bool, message: str = '', output_path: str = None, error: str = None) -> None:
@@ -84,8 +85,7 @@ class IPC:
             'outputPath': output_path or '',
             'error': error or ''
         }
-        print(json.dumps(result))
-        sys.stdout.flush()
+        write_message(result)
         
     def send_progress(self, progress_data: Dict[str, Any]) -> None:
         """Send progress update to the frontend.
@@ -100,8 +100,7 @@ class IPC:
             'type': 'progress',
             'data': progress_data
         }
-        print(json.dumps(message))
-        sys.stdout.flush()
+        write_message(message)
     
     def read_input(self):
         """Read input from stdin (Electron) or command line."""
@@ -110,7 +109,7 @@ class IPC:
                 line = sys.stdin.readline().strip()
                 if line.startswith('{'):
                     try:
-                        json.loads(line)
+                        json_loads(line)
                         return line
                     except json.JSONDecodeError:
                         continue
@@ -133,7 +132,7 @@ class IPC:
                     break
                     
                 try:
-                    message = json.loads(line)
+                    message = json_loads(line)
                     message_type = message.get('type')
                     data = message.get('data', {})
                     
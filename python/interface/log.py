@@ -54,19 +54,21 @@ def format_progress(data: Dict[str, Any]) -> Dict[str, Any]:
         Dict with fields matching the TypeScript DownloadProgress interface.
     """
     try:
+        # Get file sizes
+        downloaded_bytes = int(data.get('downloaded_bytes') or data.get('downloaded') or 0)
+        total_bytes = int(data.get('total_bytes') or data.get('total') or 0)
+
         # Calculate percentage
-        # Se il ProgressCalculator ha già calcolato "percentage", usiamo quello
+        # Se il ProgressCalculator ha già calcolato "percentage", usiamo quello;
+        # otherwise derive it from the byte counts rather than parsing '_percent_str'
         percentage = 0.0
         if data.get('percentage') is not None:
             try:
                 percentage = float(data.get('percentage', 0))
             except (ValueError, TypeError):
                 percentage = 0.0
-        elif data.get('_percent_str'):
-            try:
-                percentage = float(str(data['_percent_str']).replace('%', '').strip())
-            except (ValueError, AttributeError):
-                percentage = 0.0
+        elif total_bytes:
+            percentage = downloaded_bytes * 100.0 / total_bytes
         
         # Parse ETA - convert from string to seconds if needed
         eta = 0
@@ -90,10 +92,6 @@ def format_progress(data: Dict[str, Any]) -> Dict[str, Any]:
         # Determine status: fidiamoci dello status passato (già normalizzato dal backend)
         status = str(data.get('status', 'downloading'))
         
-        # Get file sizes
-        downloaded_bytes = int(data.get('downloaded_bytes') or data.get('downloaded') or 0)
-        total_bytes = int(data.get('total_bytes') or data.get('total') or 0)
-        
         # Get speed
         speed_str = str(data.get('_speed_str') or data.get('speed') or '0 B/s')
         
@@ -0,0 +1,51 @@
+"""
+JSON encoding and decoding for the messages exchanged with the Electron frontend.
+
+Uses orjson when it is installed (several times faster than the json module)
+and falls back to the standard library otherwise. Messages are written to
+stdout as bytes, whatever encoding the text layer of sys.stdout has.
+
+The output is always plain ASCII, with non-ASCII characters escaped as \\uXXXX.
+The frontend decodes every stdout chunk on its own, so a multibyte character
+split across two chunks would otherwise turn into U+FFFD.
+"""
+import json
+import sys
+from typing import Any
+
+try:
+    # Optional: several times faster than the json module for the IPC messages
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to ASCII-only JSON."""
+        data = orjson.dumps(obj)
+        if data.isascii():
+            return data
+        # orjson has no ensure_ascii; only messages with non-ASCII text take the slow path
+        return json.dumps(obj).encode('ascii')
+
+    loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to ASCII-only JSON."""
+        return json.dumps(obj).encode('ascii')
+
+    loads = json.loads
+
+
+def write_message(obj: Any, leading_newline: bool = False) -> None:
+    """Write ``obj`` to stdout as one line of ASCII JSON and flush it.
+
+    The bytes go straight to ``sys.stdout.buffer``: when Electron spawns the
+    process stdout is a pipe with the locale encoding (cp1252 on Windows),
+    which can't encode most titles. The text layer is flushed first so
+    earlier print() output stays in order.
+    """
+    data = dumps(obj) + b'\n'
+    if leading_newline:
+        # Start on a new line even if yt-dlp printed without one
+        data = b'\n' + data
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
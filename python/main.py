@@ -68,7 +68,10 @@ def main() -> None:
                 process_playlist=args.get('process_playlist', False),
                 progress_callback=progress_reporter,
                 max_retries=args.get('max_retries', 3),
-                timeout=args.get('timeout', 300)
+                timeout=args.get('timeout', 300),
+                use_ramdisk=args.get('use_ramdisk', False),
+                concurrency=args.get('concurrency'),
+                ffmpeg_threads=args.get('ffmpeg_threads')
             )
             
             # Send result
@@ -86,7 +89,10 @@ def main() -> None:
                 process_playlist=args.get('process_playlist', False),
                 progress_callback=progress_reporter,
                 max_retries=args.get('max_retries', 3),
-                timeout=args.get('timeout', 300)
+                timeout=args.get('timeout', 300),
+                use_ramdisk=args.get('use_ramdisk', False),
+                concurrency=args.get('concurrency'),
+                ffmpeg_threads=args.get('ffmpeg_threads')
             )
             
             # Send result
@@ -111,7 +117,10 @@ def process_single_url(
     process_playlist: bool = False,
     progress_callback: Optional[ProgressReporter] = None,
     max_retries: int = 3,
-    timeout: int = 300
+    timeout: int = 300,
+    use_ramdisk: bool = False,
+    concurrency: Optional[int] = None,
+    ffmpeg_threads: Optional[int] = None
 ) -> Tuple[bool, Optional[Path], str]:
     """Process a single URL."""
     try:
@@ -125,7 +134,10 @@ def process_single_url(
             process_playlist=process_playlist,
             progress_callback=progress_callback,
             max_retries=max_retries,
-            timeout=timeout
+            timeout=timeout,
+            use_ramdisk=use_ramdisk,
+            concurrency=concurrency,
+            ffmpeg_threads=ffmpeg_threads
         )
     except Exception as e:
         logger.exception(f"Error processing URL {url}")
@@ -141,7 +153,10 @@ def process_batch_file(
     process_playlist: bool = False,
     progress_callback: Optional[ProgressReporter] = None,
     max_retries: int = 3,
-    timeout: int = 300
+    timeout: int = 300,
+    use_ramdisk: bool = False,
+    concurrency: Optional[int] = None,
+    ffmpeg_threads: Optional[int] = None
 ) -> Tuple[bool, Optional[Path], str]:
     """Process a batch file containing multiple URLs."""
     try:
@@ -165,7 +180,10 @@ def process_batch_file(
                     process_playlist=process_playlist,
                     progress_callback=progress_callback,
                     max_retries=max_retries,
-                    timeout=timeout
+                    timeout=timeout,
+                    use_ramdisk=use_ramdisk,
+                    concurrency=concurrency,
+                    ffmpeg_threads=ffmpeg_threads
                 )
                 
                 if success: